@@ -1,33 +1,79 @@
-from flask import Flask, jsonify, render_template_string
+from flask import Flask, Response
 from datetime import datetime
 import logging
+import orjson
 import os
 import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
-from redis_manager import RedisManager
-from scraper import BuskerScraper
-from calendar_manager import CalendarManager
-from utils import get_logger
+from services import get_redis_manager, get_calendar_manager, get_scraper
+from utils import get_logger, generate_event_hashes
 
 app = Flask(__name__)
+app.json.sort_keys = False
 
 # Setup logger
 logger = get_logger('api')
 
 # Initialize managers
-redis_manager = RedisManager()
-calendar_manager = CalendarManager()
-scraper = BuskerScraper()
+redis_manager = get_redis_manager()
+calendar_manager = get_calendar_manager()
+scraper = get_scraper()
+
+# The status page is static, so read it once instead of on every request
+STATUS_PAGE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'status.html')
+try:
+    with open(STATUS_PAGE_PATH, 'rb') as f:
+        STATUS_HTML = f.read()
+except FileNotFoundError:
+    STATUS_HTML = None
+
+# Manual scrapes run on a single background worker so the request returns immediately
+scrape_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='manual-scrape')
+scrape_jobs = {}
+scrape_jobs_lock = threading.Lock()
+MAX_TRACKED_SCRAPE_JOBS = 20
+
+# Seconds to reuse connection probe results so status polling doesn't hit Redis/Google each time
+REDIS_PROBE_TTL = 2
+CALENDAR_PROBE_TTL = 10
+
+_probe_cache = {}
+
+def _json(body, status: int = 200) -> Response:
+    """Serialize a response body with orjson, which is much faster than jsonify."""
+    return Response(orjson.dumps(body), status=status, mimetype='application/json')
+
+def cached_probe(key: str, ttl: float, probe):
+    """Return the memoized result of a connection probe, re-running it once the TTL has elapsed."""
+    cached = _probe_cache.get(key)
+    now = time.monotonic()
+    if cached and now - cached[0] < ttl:
+        return cached[1]
+    result = probe()
+    _probe_cache[key] = (now, result)
+    return result
+
+def redis_connected() -> bool:
+    """Check the Redis connection, reusing a recent probe result."""
+    return cached_probe('redis', REDIS_PROBE_TTL, redis_manager.test_connection)
+
+def calendar_connected() -> bool:
+    """Check the Google Calendar connection, reusing a recent probe result."""
+    return cached_probe('calendar', CALENDAR_PROBE_TTL, calendar_manager.test_connection)
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint to verify all services are working."""
     try:
         # Check Redis connection
-        redis_status = redis_manager.test_connection()
+        redis_status = redis_connected()
         
         # Check Google Calendar connection
-        calendar_status = calendar_manager.test_connection()
+        calendar_status = calendar_connected()
         
         # Check if required config is available
         config_status = all([
@@ -47,80 +93,62 @@ def health_check():
             'overall_status': 'healthy' if all([redis_status, calendar_status, config_status]) else 'unhealthy'
         }
         
-        return jsonify(status), 200 if status['overall_status'] == 'healthy' else 503
+        return _json(status, 200 if status['overall_status'] == 'healthy' else 503)
         
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return jsonify({
+        return _json({
             'status': 'unhealthy',
             'error': str(e),
             'timestamp': datetime.now().isoformat()
-        }), 503
+        }, 503)
 
-@app.route('/scrape', methods=['POST'])
-def manual_scrape():
-    """Manually trigger the scraper to run immediately."""
+def run_scrape_job() -> dict:
+    """Scrape the busker schedule and add new events to the calendar, returning a job summary."""
     try:
-        logger.info("Manual scrape request received")
-        
-        # Test Redis connection first
-        redis_status = redis_manager.test_connection()
-        if not redis_status:
-            return jsonify({
-                'status': 'error',
-                'message': 'Redis connection failed'
-            }), 503
-        
-        # Test Calendar connection
-        calendar_status = calendar_manager.test_connection()
-        if not calendar_status:
-            return jsonify({
-                'status': 'error',
-                'message': 'Calendar connection failed'
-            }), 503
-        
-        # Run the scraper
-        events = scraper.scrape_busker_schedule()
+        # Run the scraper and drop events with malformed fields
+        events = scraper.validate_scraped_data(scraper.scrape_busker_schedule())
         
         if not events:
-            return jsonify({
+            result = {
                 'status': 'success',
                 'message': 'Scraping completed successfully',
-                'events_found': 0
-            }), 200
+                'events_found': 0,
+                'timestamp': datetime.now().isoformat()
+            }
+            redis_manager.update_manual_scrape_metadata(result)
+            return result
         
         # Process events - store in Redis and add to calendar
-        processed_count = 0
         errors = []
         
-        for event_data in events:
-            try:
-                # Store in Redis to prevent duplicates
-                event_hash = redis_manager.generate_event_hash(event_data)
-                
-                # Check if event already exists
-                if not redis_manager.event_exists(event_hash):
-                    # Create event in Google Calendar
-                    calendar_event = calendar_manager.create_event(
-                        event_data['date'], 
-                        event_data['start_time'], 
-                        event_data['end_time'], 
-                        event_data['location'],
-                        event_data['busker_name']
-                    )
-                    
-                    if calendar_event:
-                        # Store in Redis
-                        redis_manager.store_event(event_data, calendar_event['id'])
-                        processed_count += 1
-                        logger.info(f"Event processed: {event_data['date']} {event_data['location']}")
-                    else:
-                        errors.append(f"Failed to create calendar event for {event_data['date']} {event_data['location']}")
-                else:
-                    logger.info(f"Event already exists in Redis, skipping: {event_data['date']} {event_data['location']}")
-            except Exception as e:
-                errors.append(f"Error processing event {event_data.get('date', 'unknown')}: {str(e)}")
-                logger.error(f"Error processing event: {e}")
+        # Skip events that already exist in Redis, keyed by hash to drop repeats
+        event_hashes = generate_event_hashes(events)
+        new_events = {}
+        for event_hash, event_data, exists in zip(event_hashes, events, redis_manager.events_exist(event_hashes)):
+            if exists:
+                logger.info(f"Event already exists in Redis, skipping: {event_data['date']} {event_data['location']}")
+            else:
+                new_events.setdefault(event_hash, event_data)
+        
+        # Create the new events in Google Calendar using batched requests
+        created_ids = calendar_manager.create_events_batch(list(new_events.values()), list(new_events)) if new_events else {}
+        
+        # Store every successfully created event in Redis in one pipeline
+        created_events = []
+        created_hashes = []
+        for event_hash, event_data in new_events.items():
+            calendar_event_id = created_ids.get(event_hash)
+            if calendar_event_id:
+                created_events.append((event_data, calendar_event_id))
+                created_hashes.append(event_hash)
+                logger.info(f"Event processed: {event_data['date']} {event_data['location']}")
+            else:
+                errors.append(f"Failed to create calendar event for {event_data['date']} {event_data['location']}")
+        
+        processed_count = len(created_events)
+        if created_events and redis_manager.store_events_bulk(created_events, created_hashes) != processed_count:
+            errors.append("Some created events were not stored in Redis")
         
         result = {
             'status': 'success',
@@ -133,43 +161,111 @@ def manual_scrape():
         if errors:
             result['errors'] = errors
         
-        return jsonify(result), 200
-        
     except Exception as e:
         logger.error(f"Manual scrape failed: {e}")
-        # Return a proper error response even if the scraping fails
+        # Return a proper error summary even if the scraping fails
         error_message = str(e)
         if 'Executable doesn\'t exist' in error_message:
             error_message = "Browser executable not found. Playwright browsers may not be properly installed in the deployment environment."
-        return jsonify({
+        result = {
             'status': 'error',
             'message': f'Manual scrape failed: {error_message}',
             'timestamp': datetime.now().isoformat()
-        }), 500
+        }
+    
+    redis_manager.update_manual_scrape_metadata(result)
+    return result
+
+@app.route('/scrape', methods=['POST'])
+def manual_scrape():
+    """Manually trigger the scraper in the background and return a job ID to poll."""
+    try:
+        logger.info("Manual scrape request received")
+        
+        # Test Redis connection first
+        redis_status = redis_connected()
+        if not redis_status:
+            return _json({
+                'status': 'error',
+                'message': 'Redis connection failed'
+            }, 503)
+        
+        # Test Calendar connection
+        calendar_status = calendar_connected()
+        if not calendar_status:
+            return _json({
+                'status': 'error',
+                'message': 'Calendar connection failed'
+            }, 503)
+        
+        with scrape_jobs_lock:
+            # Hand back the in-flight job instead of queueing another scrape behind it
+            for job_id, future in scrape_jobs.items():
+                if not future.done():
+                    return _json({
+                        'status': 'accepted',
+                        'message': 'A manual scrape is already running',
+                        'job_id': job_id
+                    }, 202)
+            
+            job_id = uuid.uuid4().hex
+            scrape_jobs[job_id] = scrape_executor.submit(run_scrape_job)
+            
+            # Forget the oldest finished jobs
+            while len(scrape_jobs) > MAX_TRACKED_SCRAPE_JOBS:
+                del scrape_jobs[next(iter(scrape_jobs))]
+        
+        return _json({
+            'status': 'accepted',
+            'message': 'Manual scrape started',
+            'job_id': job_id
+        }, 202)
+        
+    except Exception as e:
+        logger.error(f"Failed to start manual scrape: {e}")
+        return _json({
+            'status': 'error',
+            'message': f'Failed to start manual scrape: {str(e)}',
+            'timestamp': datetime.now().isoformat()
+        }, 500)
+
+@app.route('/scrape/<job_id>', methods=['GET'])
+def scrape_job_status(job_id):
+    """Get the status or result of a manual scrape job."""
+    future = scrape_jobs.get(job_id)
+    if future is None:
+        return _json({
+            'status': 'error',
+            'message': 'Unknown scrape job'
+        }, 404)
+    
+    if not future.done():
+        return _json({
+            'status': 'running',
+            'job_id': job_id
+        }, 200)
+    
+    result = future.result()
+    return _json({'job_id': job_id, **result}, 200 if result['status'] == 'success' else 500)
 
 @app.route('/', methods=['GET'])
 def index():
     """Serve the status dashboard page."""
-    try:
-        # Read the status.html file content
-        with open('status.html', 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        return render_template_string(html_content)
-    except FileNotFoundError:
-        return jsonify({'error': 'Status page not found'}), 404
-    except Exception as e:
-        logger.error(f"Error serving status page: {e}")
-        return jsonify({'error': 'Error loading status page'}), 500
+    if STATUS_HTML is None:
+        return _json({'error': 'Status page not found'}, 404)
+    response = Response(STATUS_HTML, mimetype='text/html')
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response
 
 @app.route('/status', methods=['GET'])
 def status_check():
     """Get detailed status of the application."""
     try:
         # Get Redis connection status
-        redis_status = redis_manager.test_connection()
+        redis_status = redis_connected()
         
         # Get calendar connection status
-        calendar_status = calendar_manager.test_connection()
+        calendar_status = calendar_connected()
         
         # Get recent metrics from Redis if available
         metrics = {}
@@ -181,9 +277,11 @@ def status_check():
         
         # Get last scrape info if available
         last_scrape = {}
+        last_manual_scrape = {}
         if redis_status:
             try:
                 last_scrape = redis_manager.get_last_scrape_info()
+                last_manual_scrape = redis_manager.get_manual_scrape_metadata() or {}
             except Exception as e:
                 logger.warning(f"Could not retrieve last scrape info: {e}")
         
@@ -200,19 +298,21 @@ def status_check():
                 'timezone': Config.TIMEZONE
             },
             'metrics': metrics,
-            'last_scrape': last_scrape
+            'last_scrape': last_scrape,
+            'last_manual_scrape': last_manual_scrape
         }
         
-        return jsonify(status), 200
+        return _json(status, 200)
         
     except Exception as e:
         logger.error(f"Status check failed: {e}")
-        return jsonify({
+        return _json({
             'status': 'error',
             'error': str(e),
             'timestamp': datetime.now().isoformat()
-        }), 500
+        }, 500)
 
 if __name__ == '__main__':
+    from waitress import serve
     port = int(os.environ.get('PORT', 8080))
-    app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
+    serve(app, host='0.0.0.0', port=port, threads=Config.API_THREADS)
\ No newline at end of file
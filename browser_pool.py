@@ -0,0 +1,145 @@
+import os
+# Set environment variable before importing Playwright
+os.environ.setdefault('PLAYWRIGHT_BROWSERS_PATH', '/ms-playwright')
+
+try:
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+    sync_playwright = None
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+from config import Config
+from utils import get_logger
+
+CHROMIUM_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-default-apps',
+    '--disable-plugins',
+    '--disable-images',
+    '--no-zygote'
+]
+
+# System browsers are more reliable in container environments since we install them in the Dockerfile,
+# None falls back to Playwright's own browser
+CHROMIUM_EXECUTABLES = ["/usr/bin/chromium-browser", "/usr/bin/chromium", None]
+
+class BrowserPool:
+    """Keeps a warm Chromium and reusable browser contexts so scrapes don't cold-start a browser."""
+
+    def __init__(self, max_idle_contexts: int = 1):
+        self.logger = get_logger(__name__)
+        self.headless = Config.PLAYWRIGHT_HEADLESS
+        self.max_idle_contexts = max_idle_contexts
+        # Playwright's sync API only works on the thread that started it, so all browser work runs on this one
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='playwright')
+        self._playwright = None
+        self._browser = None
+        self._idle_contexts = []
+        self._shut_down = False
+
+    def run(self, func: Callable) -> Any:
+        """Call func with a new page from a pooled context on the browser thread and return its result."""
+        return self._executor.submit(self._run, func).result()
+
+    def _run(self, func: Callable) -> Any:
+        """Run func on a page, returning the context to the pool afterwards."""
+        context = self._acquire()
+        try:
+            page = context.new_page()
+            try:
+                result = func(page)
+            finally:
+                page.close()
+        except Exception:
+            # Don't reuse a context that may be in a bad state
+            self._close_context(context)
+            raise
+        self._release(context)
+        return result
+
+    def _acquire(self):
+        """Get an idle browser context, launching the browser if it isn't running."""
+        if self._browser is None or not self._browser.is_connected():
+            self._launch()
+        if self._idle_contexts:
+            return self._idle_contexts.pop()
+        return self._browser.new_context()
+
+    def _release(self, context):
+        """Return a browser context to the pool, closing it if the pool is full."""
+        if len(self._idle_contexts) < self.max_idle_contexts:
+            self._idle_contexts.append(context)
+        else:
+            self._close_context(context)
+
+    def _close_context(self, context):
+        """Close a browser context, ignoring errors from a browser that has gone away."""
+        try:
+            context.close()
+        except Exception as e:
+            self.logger.debug(f"Error closing browser context: {e}")
+
+    def _launch(self):
+        """Start Playwright and launch Chromium from the first executable that works, or connect to a shared one."""
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError("Playwright is not installed")
+
+        self._idle_contexts = []
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+
+        # Share a Chromium that's already running, e.g. with other scrapers, rather than starting our own
+        if Config.PLAYWRIGHT_CDP_ENDPOINT:
+            self.logger.info("Connecting to Chromium over CDP")
+            self._browser = self._playwright.chromium.connect_over_cdp(Config.PLAYWRIGHT_CDP_ENDPOINT)
+            return
+
+        for executable_path in CHROMIUM_EXECUTABLES:
+            self.logger.info(f"Attempting to launch {executable_path or 'Playwright chromium'}")
+            try:
+                self._browser = self._playwright.chromium.launch(
+                    headless=self.headless,
+                    executable_path=executable_path,
+                    args=CHROMIUM_ARGS
+                )
+                self.logger.info(f"Successfully launched {executable_path or 'Playwright chromium'}")
+                return
+            except Exception as e:
+                if executable_path is None:
+                    raise
+                self.logger.warning(f"Failed to launch {executable_path}: {e}")
+
+    def shutdown(self):
+        """Close the browser and stop Playwright, doing nothing if the pool is already shut down."""
+        if self._shut_down:
+            return
+        self._shut_down = True
+        try:
+            self._executor.submit(self._close).result()
+        except Exception as e:
+            self.logger.warning(f"Error shutting down browser pool: {e}")
+        self._executor.shutdown(wait=True)
+
+    def _close(self):
+        """Close the pooled contexts, browser and Playwright driver on the browser thread."""
+        for context in self._idle_contexts:
+            self._close_context(context)
+        self._idle_contexts = []
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
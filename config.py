@@ -19,12 +19,15 @@ class Config:
         ''
     )
     GOOGLE_CREDENTIALS_PATH = os.getenv('GOOGLE_CREDENTIALS_PATH', './credentials/service-account.json')
+    CALENDAR_CONCURRENCY = int(os.getenv('CALENDAR_CONCURRENCY', 4))  # Batch requests in flight at once
+    CALENDAR_QPS_LIMIT = int(os.getenv('CALENDAR_QPS_LIMIT', 10))  # Calendar API calls per second, 0 to disable
     
     # Redis settings
     REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
     REDIS_PORT = int(os.getenv('REDIS_PORT', 6379))
     REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', None)
     REDIS_DB = int(os.getenv('REDIS_DB', 0))
+    REDIS_UNIX_SOCKET = os.getenv('REDIS_UNIX_SOCKET', None)  # Used instead of host/port when set
     
     # Timezone settings
     TIMEZONE = os.getenv('TIMEZONE', 'Asia/Singapore')
@@ -43,6 +46,13 @@ class Config:
     # Playwright settings
     PLAYWRIGHT_TIMEOUT = int(os.getenv('PLAYWRIGHT_TIMEOUT', 30000))  # 30 seconds
     PLAYWRIGHT_HEADLESS = os.getenv('PLAYWRIGHT_HEADLESS', 'true').lower() == 'true'
+    PLAYWRIGHT_CDP_ENDPOINT = os.getenv('PLAYWRIGHT_CDP_ENDPOINT', None)  # Connect to a shared Chromium instead of launching one
+    
+    # API server settings
+    API_THREADS = int(os.getenv('API_THREADS', 8))  # Waitress worker threads
+    
+    # Profiling settings
+    BUSKER_PROFILE = os.getenv('BUSKER_PROFILE', 'false').lower() in ('1', 'true')  # Log the scrape's hottest functions
     
     # Retry settings
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', 3))
@@ -1,22 +1,18 @@
 import sys
 import signal
-import threading
 import time
 import os
 from config import Config
 from utils import setup_logging, get_logger
 from scheduler import Scheduler
-from redis_manager import RedisManager
+from services import get_redis_manager, get_scraper
 
 def run_api():
-    """Run the Flask API in a separate thread."""
-    try:
-        from api import app
-        # Run Flask with production-ready settings
-        port = int(os.environ.get('PORT', 8080))
-        app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False)
-    except Exception as e:
-        logger.error(f"Error starting API server: {e}")
+    """Run the Flask API with the Waitress WSGI server, blocking until it stops."""
+    from waitress import serve
+    from api import app
+    port = int(os.environ.get('PORT', 8080))
+    serve(app, host='0.0.0.0', port=port, threads=Config.API_THREADS)
 
 
 def main():
@@ -36,25 +32,24 @@ def main():
         sys.exit(1)
     
     # Test Redis connection
-    redis_manager = RedisManager()
+    redis_manager = get_redis_manager()
     if not redis_manager.test_connection():
         logger.error("Failed to connect to Redis")
         sys.exit(1)
+    redis_manager.preload_scripts()
     logger.info("Redis connection established successfully")
     
-    # Initialize and start scheduler
-    scheduler = Scheduler()
-    
-    # Start API server in a separate thread
-    api_thread = threading.Thread(target=run_api, daemon=True)
-    api_thread.start()
-    logger.info("API server started on port 8080")
+    # Initialize and start scheduler, sharing the Redis manager checked above
+    scheduler = Scheduler(redis_manager=redis_manager)
     
-    logger.info("Busker Scheduler Application started successfully")
     logger.info(f"Scheduler will run daily at {Config.SCRAPE_TIME_HOUR}:00 Singapore time")
     
     try:
+        # Jobs run in the background while the API server blocks the main thread
         scheduler.start()
+        logger.info("Busker Scheduler Application started successfully")
+        logger.info("API server starting on port 8080")
+        run_api()
     except KeyboardInterrupt:
         logger.info("Application interrupted by user")
     except Exception as e:
@@ -62,6 +57,7 @@ def main():
         sys.exit(1)
     finally:
         scheduler.shutdown()
+        get_scraper().close()
         logger.info("Busker Scheduler Application stopped")
 
 if __name__ == "__main__":
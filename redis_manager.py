@@ -1,27 +1,139 @@
 import redis
-import json
+import orjson
+import socket
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 from config import Config
-from utils import get_logger, generate_event_hash
+from utils import get_logger, generate_event_hash, generate_event_hashes
+
+def _keepalive_options() -> Dict[int, int]:
+    """Build TCP keepalive options for the platforms that support them."""
+    options = {}
+    for name, value in (('TCP_KEEPIDLE', 60), ('TCP_KEEPINTVL', 10), ('TCP_KEEPCNT', 3)):
+        if hasattr(socket, name):
+            options[getattr(socket, name)] = value
+    return options
+
+@lru_cache(maxsize=4096)
+def _date_to_timestamp(date_str: str) -> int:
+    """Convert a YYYY-MM-DD string to the timestamp of local midnight, cached since scrapes repeat dates."""
+    return int(datetime.fromisoformat(date_str).timestamp())
+
+def _dumps(obj) -> bytes:
+    """Serialize a value to JSON with orjson."""
+    return orjson.dumps(obj)
+
+def _loads(data):
+    """Deserialize JSON from a str or bytes value with orjson."""
+    return orjson.loads(data)
+
+# Stream of recent errors, newest last
+ERRORS_STREAM_KEY = "errors:stream"
+
+# Keys fetched per MGET when reading events in bulk
+MGET_CHUNK_SIZE = 1000
+
+# Events written per pipeline when updating in bulk, so a large sync doesn't hold Redis up with one huge batch
+PIPELINE_CHUNK_SIZE = 500
+
+# Hash of event hash -> calendar event ID, so duplicate checks are a single HMGET.
+# Every write refreshes the hash's TTL, so stale entries are pruned by cleanup_old_events in the daily sync job.
+SEEN_EVENTS_KEY = "busker:events:seen"
+
+# Deletes a lock only if it still holds the caller's value
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+else
+    return 0
+end
+"""
+
+# Stores an event only if its key is absent, returning 1 if stored and 0 if already present
+DEDUP_STORE_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    return 0
+end
+redis.call("SETEX", KEYS[1], ARGV[1], ARGV[2])
+redis.call("ZADD", KEYS[2], ARGV[3], ARGV[4])
+redis.call("HSET", KEYS[3], ARGV[4], ARGV[5])
+redis.call("EXPIRE", KEYS[3], ARGV[1])
+return 1
+"""
+
+# Reserves Calendar API quota using GCRA: the key holds the time the quota is next free.
+# Returns how long the caller must wait before making its requests.
+CALENDAR_QUOTA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local cost = tonumber(ARGV[2])
+local burst = tonumber(ARGV[3])
+local tat = tonumber(redis.call("GET", KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local new_tat = tat + cost
+redis.call("SET", KEYS[1], tostring(new_tat), "PX", math.ceil((new_tat - now) * 1000) + 1000)
+return tostring(math.max(tat - now - burst, 0))
+"""
+
+def _connection_pool() -> redis.ConnectionPool:
+    """Build the connection pool, using a UNIX socket when Redis runs on the same host."""
+    options = dict(
+        password=Config.REDIS_PASSWORD,
+        db=Config.REDIS_DB,
+        decode_responses=True,
+        max_connections=32,
+        socket_timeout=5,
+        socket_connect_timeout=5,
+        health_check_interval=30
+    )
+    if Config.REDIS_UNIX_SOCKET:
+        return redis.ConnectionPool(
+            connection_class=redis.UnixDomainSocketConnection,
+            path=Config.REDIS_UNIX_SOCKET,
+            **options
+        )
+    return redis.ConnectionPool(
+        host=Config.REDIS_HOST,
+        port=Config.REDIS_PORT,
+        socket_keepalive=True,
+        socket_keepalive_options=_keepalive_options(),
+        **options
+    )
+
+# Connection pool shared by every RedisManager instance in the process
+_POOL = _connection_pool()
+
+# Seconds a successful command counts as proof that the connection works
+LIVENESS_WINDOW = 1
+
+class _TrackingRedis(redis.Redis):
+    """Redis client that records when a command last succeeded."""
+    last_ok = float('-inf')
+    
+    def execute_command(self, *args, **options):
+        result = super().execute_command(*args, **options)
+        self.last_ok = time.monotonic()
+        return result
 
 class RedisManager:
     """Manages Redis connections and operations for the busker scheduler."""
     
     def __init__(self):
         self.logger = get_logger(__name__)
-        self.redis_client = redis.Redis(
-            host=Config.REDIS_HOST,
-            port=Config.REDIS_PORT,
-            password=Config.REDIS_PASSWORD,
-            db=Config.REDIS_DB,
-            decode_responses=True
-        )
+        self.redis_client = _TrackingRedis(connection_pool=_POOL)
         self.ttl_seconds = Config.EVENT_TTL_SECONDS
+        # Scripts are registered once so each call is a single EVALSHA
+        self._release_lock_script = self.redis_client.register_script(RELEASE_LOCK_SCRIPT)
+        self._dedup_store_script = self.redis_client.register_script(DEDUP_STORE_SCRIPT)
+        self._calendar_quota_script = self.redis_client.register_script(CALENDAR_QUOTA_SCRIPT)
         
     def test_connection(self) -> bool:
-        """Test Redis connection."""
+        """Test Redis connection, trusting any command that succeeded within the last second."""
+        if time.monotonic() - self.redis_client.last_ok < LIVENESS_WINDOW:
+            return True
         try:
             self.redis_client.ping()
             return True
@@ -29,52 +141,139 @@ class RedisManager:
             self.logger.error(f"Redis connection failed: {e}")
             return False
     
-    def store_event(self, event_data: Dict[str, Any], calendar_event_id: str = None) -> bool:
-        """Store an event in Redis with TTL, optionally including calendar event ID."""
-        try:
+    def _queue_store_event(self, pipe, event_data: Dict[str, Any], calendar_event_id: Optional[str] = None, event_hash: Optional[str] = None):
+        """Queue the SETEX, ZADD and HSET that store one event on a pipeline."""
+        if event_hash is None:
             event_hash = generate_event_hash(event_data)
-            event_key = f"event:{event_hash}"
-            
-            # Add calendar event ID to the event data if provided
-            if calendar_event_id:
-                event_data['calendar_event_id'] = calendar_event_id
-            
-            # Store event data as a JSON string
-            event_json = json.dumps(event_data)
-            
-            # Store with TTL
-            result = self.redis_client.setex(
-                event_key,
-                self.ttl_seconds,
-                event_json
-            )
-            
-            # Add to timeline sorted set for date-based queries
-            timestamp = self._date_to_timestamp(event_data['date'])
-            self.redis_client.zadd("events_timeline", {event_hash: timestamp})
+        
+        # Add calendar event ID to the event data if provided
+        if calendar_event_id:
+            event_data['calendar_event_id'] = calendar_event_id
+        
+        # Store with TTL, add to the timeline for date-based queries and index for duplicate checks
+        pipe.setex(f"event:{event_hash}", self.ttl_seconds, _dumps(event_data))
+        # The hash covers the date, so an existing entry's score never changes and NX skips the rewrite
+        pipe.zadd("events_timeline", {event_hash: self._date_to_timestamp(event_data['date'])}, nx=True)
+        pipe.hset(SEEN_EVENTS_KEY, event_hash, calendar_event_id or '')
+    
+    def preload_scripts(self) -> bool:
+        """Load the Lua scripts into Redis's script cache so the first calls are plain EVALSHAs."""
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for script in (RELEASE_LOCK_SCRIPT, DEDUP_STORE_SCRIPT, CALENDAR_QUOTA_SCRIPT):
+                pipe.script_load(script)
+            pipe.execute()
+            return True
+        except Exception as e:
+            self.logger.error(f"Error preloading Redis scripts: {e}")
+            return False
+    
+    def store_event(self, event_data: Dict[str, Any], calendar_event_id: str = None, event_hash: Optional[str] = None) -> bool:
+        """Store an event in Redis with TTL, optionally including calendar event ID and a precomputed hash."""
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            self._queue_store_event(pipe, event_data, calendar_event_id, event_hash)
+            pipe.expire(SEEN_EVENTS_KEY, self.ttl_seconds)
             
+            result = pipe.execute()[0]
             return result is not None
         except Exception as e:
             self.logger.error(f"Error storing event in Redis: {e}")
             return False
     
-    def event_exists(self, event_data: Dict[str, Any]) -> bool:
-        """Check if an event already exists in Redis."""
+    def store_events_bulk(self, events: List[Tuple[Dict[str, Any], Optional[str]]], event_hashes: Optional[List[str]] = None) -> int:
+        """Atomically store (event_data, calendar_event_id) pairs not already in Redis, returning how many were stored."""
+        if not events:
+            return 0
         try:
-            event_hash = generate_event_hash(event_data)
+            # Callers that already hashed the events pass the hashes in the same order
+            if event_hashes is None:
+                event_hashes = generate_event_hashes([event_data for event_data, _ in events])
+            
+            pipe = self.redis_client.pipeline(transaction=False)
+            for event_hash, (event_data, calendar_event_id) in zip(event_hashes, events):
+                if calendar_event_id:
+                    event_data['calendar_event_id'] = calendar_event_id
+                
+                self._dedup_store_script(
+                    keys=[f"event:{event_hash}", "events_timeline", SEEN_EVENTS_KEY],
+                    args=[self.ttl_seconds, _dumps(event_data), self._date_to_timestamp(event_data['date']), event_hash, calendar_event_id or ''],
+                    client=pipe
+                )
+            
+            stored = sum(pipe.execute())
+            if stored < len(events):
+                self.logger.warning(f"{len(events) - stored} events were already stored in Redis by another run")
+            return stored
+        except Exception as e:
+            self.logger.error(f"Error storing events in Redis: {e}")
+            return 0
+    
+    def update_events_bulk(self, events: List[Tuple[Dict[str, Any], Optional[str]]], event_hashes: Optional[List[str]] = None) -> int:
+        """Overwrite (event_data, calendar_event_id) pairs in chunked pipelines and return how many were stored."""
+        if not events:
+            return 0
+        try:
+            if event_hashes is None:
+                event_hashes = generate_event_hashes([event_data for event_data, _ in events])
+            
+            stored = 0
+            for start in range(0, len(events), PIPELINE_CHUNK_SIZE):
+                end = start + PIPELINE_CHUNK_SIZE
+                pipe = self.redis_client.pipeline(transaction=False)
+                for event_hash, (event_data, calendar_event_id) in zip(event_hashes[start:end], events[start:end]):
+                    self._queue_store_event(pipe, event_data, calendar_event_id, event_hash)
+                pipe.expire(SEEN_EVENTS_KEY, self.ttl_seconds)
+                
+                # Every event queues SETEX, ZADD and HSET, so every third reply is a SETEX
+                results = pipe.execute()
+                stored += sum(1 for result in results[:-1:3] if result)
+            return stored
+        except Exception as e:
+            self.logger.error(f"Error updating events in Redis: {e}")
+            return 0
+    
+    def event_exists(self, event_data: Dict[str, Any], event_hash: Optional[str] = None) -> bool:
+        """Check if an event already exists in Redis, optionally using a precomputed hash."""
+        try:
+            if event_hash is None:
+                event_hash = generate_event_hash(event_data)
+            if self.redis_client.hexists(SEEN_EVENTS_KEY, event_hash):
+                return True
+            # Events stored before the index existed only have their own key
             event_key = f"event:{event_hash}"
             return self.redis_client.exists(event_key) == 1
         except Exception as e:
             self.logger.error(f"Error checking if event exists in Redis: {e}")
             return False
     
+    def events_exist(self, event_hashes: List[str]) -> List[bool]:
+        """Check which of the given event hashes already exist in Redis with one HMGET on the seen index."""
+        if not event_hashes:
+            return []
+        try:
+            exists = [value is not None for value in self.redis_client.hmget(SEEN_EVENTS_KEY, event_hashes)]
+            
+            # Events stored before the index existed only have their own key, so check misses in one pipeline
+            missing = [i for i, found in enumerate(exists) if not found]
+            if missing:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for i in missing:
+                    pipe.exists(f"event:{event_hashes[i]}")
+                for i, result in zip(missing, pipe.execute()):
+                    exists[i] = result == 1
+            return exists
+        except Exception as e:
+            self.logger.error(f"Error checking if events exist in Redis: {e}")
+            return [False] * len(event_hashes)
+    
     def get_event(self, event_hash: str) -> Optional[Dict[str, Any]]:
         """Retrieve an event from Redis by its hash."""
         try:
             event_key = f"event:{event_hash}"
             event_json = self.redis_client.get(event_key)
             if event_json:
-                return json.loads(event_json)
+                return _loads(event_json)
             return None
         except Exception as e:
             self.logger.error(f"Error retrieving event from Redis: {e}")
@@ -102,24 +301,27 @@ class RedisManager:
         """Release a distributed lock using Redis Lua script."""
         lock_key = f"scraper:lock:{lock_name}"
         
-        # Lua script to ensure we only delete the lock if it still has the same value
-        lua_script = """
-        if redis.call("GET", KEYS[1]) == ARGV[1] then
-            return redis.call("DEL", KEYS[1])
-        else
-            return 0
-        end
-        """
-        
-        script = self.redis_client.register_script(lua_script)
-        result = script(keys=[lock_key], args=[lock_value])
+        result = self._release_lock_script(keys=[lock_key], args=[lock_value])
         return result == 1
     
+    def reserve_calendar_quota(self, count: int, qps_limit: int) -> float:
+        """Reserve quota for count Calendar API calls shared across instances, returning seconds to wait first."""
+        try:
+            wait = self._calendar_quota_script(
+                keys=["calendar:quota"],
+                args=[time.time(), count / qps_limit, 1]
+            )
+            return float(wait)
+        except Exception as e:
+            # Never block calendar calls because Redis is unavailable
+            self.logger.error(f"Error reserving calendar quota: {e}")
+            return 0
+    
     def update_last_run_metadata(self, metadata: Dict[str, Any]) -> bool:
         """Update the last run metadata in Redis."""
         try:
             metadata_key = "scraper:last_run"
-            metadata_json = json.dumps(metadata)
+            metadata_json = _dumps(metadata)
             return self.redis_client.set(metadata_key, metadata_json) is not None
         except Exception as e:
             self.logger.error(f"Error updating last run metadata: {e}")
@@ -131,12 +333,34 @@ class RedisManager:
             metadata_key = "scraper:last_run"
             metadata_json = self.redis_client.get(metadata_key)
             if metadata_json:
-                return json.loads(metadata_json)
+                return _loads(metadata_json)
             return None
         except Exception as e:
             self.logger.error(f"Error getting last run metadata: {e}")
             return None
     
+    def update_manual_scrape_metadata(self, metadata: Dict[str, Any]) -> bool:
+        """Update the summary of the last manual scrape in Redis."""
+        try:
+            metadata_key = "scraper:last_manual_run"
+            metadata_json = _dumps(metadata)
+            return self.redis_client.set(metadata_key, metadata_json) is not None
+        except Exception as e:
+            self.logger.error(f"Error updating manual scrape metadata: {e}")
+            return False
+    
+    def get_manual_scrape_metadata(self) -> Optional[Dict[str, Any]]:
+        """Get the summary of the last manual scrape from Redis."""
+        try:
+            metadata_key = "scraper:last_manual_run"
+            metadata_json = self.redis_client.get(metadata_key)
+            if metadata_json:
+                return _loads(metadata_json)
+            return None
+        except Exception as e:
+            self.logger.error(f"Error getting manual scrape metadata: {e}")
+            return None
+    
     def log_error(self, error_message: str) -> bool:
         """Log an error message to Redis."""
         try:
@@ -144,35 +368,51 @@ class RedisManager:
                 "timestamp": datetime.now().isoformat(),
                 "message": error_message
             }
-            error_json = json.dumps(error_entry)
             
-            # Add to errors list, keeping only the last 100 entries
-            self.redis_client.lpush("errors:log", error_json)
-            self.redis_client.ltrim("errors:log", 0, 99)
+            # Append to the errors stream, capped at roughly the last 100 entries
+            self.redis_client.xadd(ERRORS_STREAM_KEY, error_entry, maxlen=100, approximate=True)
             return True
         except Exception as e:
             self.logger.error(f"Error logging error to Redis: {e}")
             return False
     
-    def increment_metric(self, metric_name: str, date: str = None) -> bool:
+    def log_errors(self, errors: List[Tuple[str, str]]) -> bool:
+        """Log buffered (timestamp, message) errors to Redis with a single pipeline."""
+        if not errors:
+            return True
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for timestamp, error_message in errors:
+                pipe.xadd(ERRORS_STREAM_KEY, {"timestamp": timestamp, "message": error_message}, maxlen=100, approximate=True)
+            pipe.execute()
+            return True
+        except Exception as e:
+            self.logger.error(f"Error logging errors to Redis: {e}")
+            return False
+    
+    def increment_metric(self, metric_name: str, date: str = None, count: int = 1) -> bool:
         """Increment a metric counter in Redis."""
+        return self.increment_metrics({metric_name: count}, date)
+    
+    def increment_metrics(self, metrics: Dict[str, int], date: str = None) -> bool:
+        """Increment several metric counters in Redis with a single pipeline."""
         try:
             if date is None:
                 from utils import get_current_singapore_time
                 date = get_current_singapore_time().strftime("%Y-%m-%d")
             
             metric_key = f"metrics:daily:{date}"
-            field_name = metric_name
-            
-            # Increment the counter
-            result = self.redis_client.hincrby(metric_key, field_name, 1)
             
-            # Set TTL on the metrics hash to match event TTL
-            self.redis_client.expire(metric_key, self.ttl_seconds)
+            # Increment the counters and set TTL on the metrics hash to match event TTL
+            pipe = self.redis_client.pipeline(transaction=False)
+            for metric_name, count in metrics.items():
+                pipe.hincrby(metric_key, metric_name, count)
+            pipe.expire(metric_key, self.ttl_seconds)
+            pipe.execute()
             
-            return result is not None
+            return True
         except Exception as e:
-            self.logger.error(f"Error incrementing metric in Redis: {e}")
+            self.logger.error(f"Error incrementing metrics in Redis: {e}")
             return False
     
     def get_metrics(self, date: str = None) -> Dict[str, int]:
@@ -183,20 +423,21 @@ class RedisManager:
                 date = get_current_singapore_time().strftime("%Y-%m-%d")
             
             metric_key = f"metrics:daily:{date}"
-            metrics = self.redis_client.hgetall(metric_key)
-            
-            # Convert string values to integers
-            for key, value in metrics.items():
-                try:
-                    metrics[key] = int(value)
-                except ValueError:
-                    metrics[key] = 0
-            
-            return metrics
+            return self._parse_metrics(self.redis_client.hgetall(metric_key))
         except Exception as e:
             self.logger.error(f"Error getting metrics from Redis: {e}")
             return {}
     
+    def _parse_metrics(self, metrics: Dict[str, str]) -> Dict[str, int]:
+        """Convert the string values of a metrics hash to integers, treating anything non-numeric as 0."""
+        parsed = {}
+        for key, value in metrics.items():
+            try:
+                parsed[key] = int(value)
+            except ValueError:
+                parsed[key] = 0
+        return parsed
+    
     def get_events_by_date_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """Get events within a date range."""
         try:
@@ -208,11 +449,12 @@ class RedisManager:
                 "events_timeline", start_timestamp, end_timestamp
             )
             
+            # Fetch the events with MGET in chunks instead of one GET per event
             events = []
-            for event_hash in event_hashes:
-                event_data = self.get_event(event_hash)
-                if event_data:
-                    events.append(event_data)
+            for start in range(0, len(event_hashes), MGET_CHUNK_SIZE):
+                chunk = event_hashes[start:start + MGET_CHUNK_SIZE]
+                event_jsons = self.redis_client.mget([f"event:{event_hash}" for event_hash in chunk])
+                events.extend(_loads(event_json) for event_json in event_jsons if event_json)
             
             return events
         except Exception as e:
@@ -221,20 +463,12 @@ class RedisManager:
     
     def _date_to_timestamp(self, date_str: str) -> int:
         """Convert date string to timestamp."""
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        return int(date_obj.timestamp())
+        return _date_to_timestamp(date_str)
     
     def get_recent_errors(self, count: int = 10) -> List[Dict[str, Any]]:
         """Get recent error logs from Redis."""
         try:
-            error_logs = self.redis_client.lrange("errors:log", 0, count - 1)
-            errors = []
-            for error_json in error_logs:
-                try:
-                    errors.append(json.loads(error_json))
-                except json.JSONDecodeError:
-                    continue
-            return errors
+            return [fields for _, fields in self.redis_client.xrevrange(ERRORS_STREAM_KEY, count=count)]
         except Exception as e:
             self.logger.error(f"Error getting recent errors from Redis: {e}")
             return []
@@ -242,15 +476,16 @@ class RedisManager:
     def cleanup_old_events(self) -> int:
         """Clean up events that have expired."""
         try:
-            # Since we use TTL, events should expire automatically
-            # But we can still remove expired entries from the timeline
+            # Event keys expire by TTL, but their timeline and seen index entries must be removed here
             from utils import get_current_singapore_time
             current_timestamp = int(get_current_singapore_time().timestamp())
             
-            # Remove expired entries from timeline
-            removed_count = self.redis_client.zremrangebyscore(
-                "events_timeline", 0, current_timestamp - self.ttl_seconds
-            )
+            # Remove expired entries from timeline and the seen index
+            cutoff = current_timestamp - self.ttl_seconds
+            expired_hashes = self.redis_client.zrangebyscore("events_timeline", 0, cutoff)
+            if expired_hashes:
+                self.redis_client.hdel(SEEN_EVENTS_KEY, *expired_hashes)
+            removed_count = self.redis_client.zremrangebyscore("events_timeline", 0, cutoff)
             
             return removed_count
         except Exception as e:
@@ -263,17 +498,17 @@ class RedisManager:
             from utils import get_current_singapore_time
             current_date = get_current_singapore_time().strftime("%Y-%m-%d")
             
-            metrics = self.get_metrics(current_date)
-            
-            # Also get total event count
-            event_count = self.redis_client.zcard("events_timeline")
-            
-            # Get lock status
-            lock_exists = self.redis_client.exists("scraper:lock") == 1
+            # Read the metrics, total event count and lock status in one round-trip
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hgetall(f"metrics:daily:{current_date}")
+            pipe.zcard("events_timeline")
+            pipe.exists("scraper:lock:scrape_job", "scraper:lock:sync_job")
+            metrics, event_count, locks_held = pipe.execute()
+            lock_exists = locks_held > 0
             
             return {
                 "date": current_date,
-                "metrics": metrics,
+                "metrics": self._parse_metrics(metrics),
                 "total_events": event_count,
                 "lock_exists": lock_exists
             }
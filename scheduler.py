@@ -1,25 +1,30 @@
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
-import pytz
 import signal
 import sys
 from typing import Callable
-from scraper import BuskerScraper
-from calendar_manager import CalendarManager
-from redis_manager import RedisManager
+from services import get_redis_manager, get_calendar_manager, get_scraper
 from config import Config
-from utils import get_logger, get_current_singapore_time
+from utils import get_logger, get_current_singapore_time, generate_event_hashes
 
 class Scheduler:
     """Manages the scheduling of busker scraping and calendar updates."""
     
-    def __init__(self):
+    def __init__(self, scraper=None, calendar_manager=None, redis_manager=None):
         self.logger = get_logger(__name__)
-        self.scheduler = BlockingScheduler()
-        self.scraper = BuskerScraper()
-        self.calendar_manager = CalendarManager()
-        self.redis_manager = RedisManager()
+        # Jobs run on the scheduler's own threads so the API can serve from the main thread.
+        # One worker per job lets the scrape and sync overlap without idle threads, and
+        # coalescing collapses missed runs into one
+        self.scheduler = BackgroundScheduler(
+            executors={'default': ThreadPoolExecutor(2)},
+            job_defaults={'coalesce': True, 'max_instances': 1}
+        )
+        # Collaborators default to the process-wide shared instances
+        self.scraper = scraper or get_scraper()
+        self.calendar_manager = calendar_manager or get_calendar_manager()
+        self.redis_manager = redis_manager or get_redis_manager()
         
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -70,9 +75,12 @@ class Scheduler:
             self.logger.info("Another instance is already running, skipping this execution")
             return
         
+        # Metrics for this run, written in one pipeline when the job finishes
+        run_metrics = {"scrapes_attempted": 1}
+        # Errors are buffered as (timestamp, message) and logged together at the end of the run
+        run_errors = []
+        
         try:
-            # Update metrics
-            self.redis_manager.increment_metric("scrapes_attempted")
             
             # Scrape the busker schedule
             self.logger.info("Scraping busker schedule...")
@@ -83,56 +91,72 @@ class Scheduler:
             
             if not validated_events:
                 self.logger.warning("No valid events found in scraping")
-                self.redis_manager.increment_metric("scrapes_no_events")
+                run_metrics["scrapes_no_events"] = 1
                 return
             
             self.logger.info(f"Found {len(validated_events)} valid events to process")
             
-            # Process each event
-            events_created = 0
-            events_skipped = 0
+            # Check every scraped event against Redis in one round-trip (duplicate prevention)
+            event_hashes = generate_event_hashes(validated_events)
+            in_redis = self.redis_manager.events_exist(event_hashes)
             
-            for event_data in validated_events:
+            # List the calendar once for the dates of the Redis misses instead of once per event,
+            # and not at all when every event is already in Redis
+            missing_dates = {event['date'] for event, exists in zip(validated_events, in_redis) if not exists}
+            day_index = self.calendar_manager.prefetch_day_index(missing_dates) if missing_dates else {}
+            
+            events_skipped = 0
+            to_store = []
+            store_hashes = []
+            to_create = {}
+            # Hashes already handled this run, so repeated events skip the calendar check too
+            seen = set()
+            
+            for event_hash, event_data, exists in zip(event_hashes, validated_events, in_redis):
+                if exists or event_hash in seen:
+                    self.logger.debug(f"Event already exists in Redis, skipping: {event_data}")
+                    events_skipped += 1
+                    continue
+                seen.add(event_hash)
+                
                 try:
-                    # Check if event already exists in Redis (duplicate prevention)
-                    if self.redis_manager.event_exists(event_data):
-                        self.logger.debug(f"Event already exists in Redis, skipping: {event_data}")
-                        events_skipped += 1
-                        continue
-                    
                     # Check if event already exists in Google Calendar
-                    existing_event_id = self.calendar_manager.event_exists(event_data)
+                    existing_event_id = self.calendar_manager.event_exists(event_data, day_index)
                     if existing_event_id:
                         self.logger.debug(f"Event already exists in Google Calendar, skipping: {event_data}")
                         # Store the event in Redis to prevent future duplicates
-                        event_data['calendar_event_id'] = existing_event_id
-                        self.redis_manager.store_event(event_data)
+                        to_store.append((event_data, existing_event_id))
+                        store_hashes.append(event_hash)
                         events_skipped += 1
                         continue
                     
-                    # Create the event in Google Calendar
-                    event_id = self.calendar_manager.create_event(event_data)
-                    
-                    if event_id:
-                        # Store event in Redis with the calendar event ID
-                        event_data['calendar_event_id'] = event_id
-                        success = self.redis_manager.store_event(event_data)
-                        
-                        if success:
-                            events_created += 1
-                            self.logger.info(f"Successfully created and stored event: {event_data['date']} {event_data['start_time']} at {event_data['location']}")
-                        else:
-                            self.logger.error(f"Failed to store event in Redis: {event_data}")
-                    else:
-                        self.logger.error(f"Failed to create event in Google Calendar: {event_data}")
+                    to_create[event_hash] = event_data
                         
                 except Exception as e:
                     self.logger.error(f"Error processing event {event_data}: {e}")
-                    self.redis_manager.log_error(f"Error processing event {event_data}: {e}")
+                    run_errors.append((datetime.now().isoformat(), f"Error processing event {event_data}: {e}"))
+            
+            # Create the new events in Google Calendar using batched requests
+            created_ids = self.calendar_manager.create_events_batch(list(to_create.values()), list(to_create)) if to_create else {}
+            
+            events_created = 0
+            for event_hash, event_data in to_create.items():
+                event_id = created_ids.get(event_hash)
+                if event_id:
+                    to_store.append((event_data, event_id))
+                    store_hashes.append(event_hash)
+                    events_created += 1
+                    self.logger.info(f"Successfully created event: {event_data['date']} {event_data['start_time']} at {event_data['location']}")
+                else:
+                    self.logger.error(f"Failed to create event in Google Calendar: {event_data}")
+            
+            # Store created and already-present events in Redis in a single pipeline
+            if to_store and self.redis_manager.store_events_bulk(to_store, store_hashes) != len(to_store):
+                self.logger.error(f"Not all of {len(to_store)} events were stored in Redis")
             
             # Update metrics
-            self.redis_manager.increment_metric("events_created", count=events_created)
-            self.redis_manager.increment_metric("events_skipped", count=events_skipped)
+            run_metrics["events_created"] = events_created
+            run_metrics["events_skipped"] = events_skipped
             
             # Update last run metadata
             last_run_metadata = {
@@ -148,7 +172,7 @@ class Scheduler:
             
         except Exception as e:
             self.logger.error(f"Error in scraping job: {e}")
-            self.redis_manager.log_error(f"Scraping job error: {e}")
+            run_errors.append((datetime.now().isoformat(), f"Scraping job error: {e}"))
             
             # Update last run metadata with error status
             last_run_metadata = {
@@ -158,9 +182,12 @@ class Scheduler:
             }
             self.redis_manager.update_last_run_metadata(last_run_metadata)
             
-            self.redis_manager.increment_metric("scrapes_errors")
+            run_metrics["scrapes_errors"] = 1
         
         finally:
+            self.redis_manager.increment_metrics(run_metrics)
+            self.redis_manager.log_errors(run_errors)
+            
             # Release the lock
             self.redis_manager.release_lock(lock_name, lock_value)
             self.logger.info("Scraping job finished and lock released")
@@ -178,9 +205,10 @@ class Scheduler:
                 self.logger.info("Another sync instance is already running, skipping this execution")
                 return
             
-            # Get all events from Redis
-            # For this example, we'll get events for the next 90 days
-            from utils import get_current_singapore_time
+            # Prune timeline and seen index entries for events past their TTL
+            removed_count = self.redis_manager.cleanup_old_events()
+            self.logger.info(f"Removed {removed_count} expired events from Redis")
+            
             current_date = get_current_singapore_time().strftime("%Y-%m-%d")
             
             # This is a simplified sync - in a real implementation, you might want to:
@@ -211,8 +239,9 @@ class Scheduler:
     
     def shutdown(self):
         """Shutdown the scheduler gracefully."""
-        self.logger.info("Shutting down scheduler...")
-        self.scheduler.shutdown()
+        if self.scheduler.running:
+            self.logger.info("Shutting down scheduler...")
+            self.scheduler.shutdown()
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
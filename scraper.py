@@ -4,31 +4,295 @@ os.environ.setdefault('PLAYWRIGHT_BROWSERS_PATH', '/ms-playwright')
 
 # Import Playwright as fallback
 try:
-    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     PlaywrightTimeoutError = None
-    sync_playwright = None
 
-from bs4 import BeautifulSoup
+# selectolax is optional, BeautifulSoup is used when it isn't installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    LexborHTMLParser = None
+    SELECTOLAX_AVAILABLE = False
+
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
-from urllib.parse import urljoin
+from urllib.parse import urlparse
+import calendar
+import html
 import re
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-import pytz
+import string
+from functools import lru_cache
+from typing import Callable, Iterable, List, Dict, Any, Optional, Tuple, Union
+from datetime import date, datetime, timedelta
+from browser_pool import BrowserPool
 from config import Config
-from utils import get_logger, retry_with_backoff
+from utils import get_logger, profile_call, retry_with_backoff
+
+# Patterns are compiled once here rather than on every booking item and text match
+_BOOKING_DATE_RE = re.compile(r'[A-Za-z]{3},\s*\d{2}\s+\w+')
+_DAY_MONTH_RE = re.compile(r'(\d{2}\s+\w+)')
+_BOOKING_TIME_RANGE_RE = re.compile(r'(\d{1,2}:\d{2}:[AaPp][Mm])\s*[-–]\s*(\d{1,2}:\d{2}:[AaPp][Mm])')
+_MERIDIAN_SUFFIX_RE = re.compile(r':([AaPp][Mm])')
+_TRAILING_LOCATION_RE = re.compile(r'[\w\s,\.\(\)-]+$')
+_MONTH_PATTERN = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'
+_ANY_DATE_PATTERN = rf'\d{{4}}-\d{{2}}-\d{{2}}|\d{{1,2}}/\d{{1,2}}/\d{{4}}|{_MONTH_PATTERN}.*\d{{1,2}}.*\d{{4}}'
+_ANY_DATE_RE = re.compile(_ANY_DATE_PATTERN)
+_ANY_DATE_IGNORECASE_RE = re.compile(_ANY_DATE_PATTERN, re.IGNORECASE)
+# Times like 7:30, 7:30 PM or 7.30pm
+_ANY_TIME_RE = re.compile(r'\d{1,2}:\d{2}\s*(AM|PM|am|pm)?|\d{1,2}\.\d{2}', re.IGNORECASE)
+_LOCATION_HINT_RE = re.compile(r'location|venue|@|at|\bat\b|\bpark\b|\btheatre\b|\bstreet\b|\bplaza\b', re.IGNORECASE)
+_LOCATION_LIKE_RE = re.compile(r'[A-Z][a-z]+.*[A-Z][a-z]+|.*Singapore|.*St\.?|.*Ave\.?|.*Rd\.?|.*Lane|.*Circle|.*Plaza|.*Park|.*Theatre|.*Center|.*Centre', re.IGNORECASE)
+_LOCATION_PREFIX_RE = re.compile(r'location[:\s]*|venue[:\s]*|@|at[:\s]*', re.IGNORECASE)
+_PERFORMER_RE = re.compile(r'busker|performer|artist|musician|band|singer|guitarist|violinist', re.IGNORECASE)
+_DATE_OR_TIME_LINE_RE = re.compile(r'\d.*\d|.*\d{4}.*|.*\d{1,2}:\d{2}.*')
+# Matches the format: "Fri, 02 January 06:00:PM - 07:00:PM HOUGANG CENTRAL HUB"
+_EVENT_LINE_RE = re.compile(r'([A-Za-z]{3}, \d{2} \w+ \d{4})\s+(\d{1,2}:\d{2})\s*([AaPp][Mm])\s*-\s*(\d{1,2}:\d{2})\s*([AaPp][Mm])\s+([A-Z\s]+)')
+_DAY_MONTH_YEAR_RE = re.compile(r'(\d{2} \w+ \d{4})')
+_TEXT_DATE_RE = re.compile(
+    r'(?P<iso>\d{4}-\d{2}-\d{2})'
+    r'|(?P<slash>\d{1,2}/\d{1,2}/\d{4})'
+    rf'|(?P<month_day>{_MONTH_PATTERN}[a-z]*\s+\d{{1,2}},?\s+\d{{4}})'
+    rf'|(?P<day_month>\d{{1,2}}\s+{_MONTH_PATTERN}[a-z]*\s+\d{{4}})',
+    re.IGNORECASE
+)
+_TEXT_TIME_RE = re.compile(r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?)')
+_TEXT_LOCATION_RE = re.compile(r'at\s+([A-Z][^,.\n]{10,50})|@([A-Z][^,.\n]{10,50})', re.IGNORECASE)
+# Time ranges like "7:30pm - 9:30pm" or "7.30pm to 9.30pm"
+_TIME_RANGE_RE = re.compile(r'(\d{1,2}[:\.]\d{2}\s*(?:AM|PM|am|pm)?)\s*[-–to]+\s*(\d{1,2}[:\.]\d{2}\s*(?:AM|PM|am|pm)?)', re.IGNORECASE)
+_BARE_HOUR_MERIDIAN_RE = re.compile(r'^(0?[1-9]|1[0-2])([ap])m$', re.IGNORECASE)
+# Valid times, checked up front instead of catching strptime failures
+_ISO_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+_TIME_24H_RE = re.compile(r'^([01]?\d|2[0-3]):[0-5]?\d$')
+_TIME_12H_RE = re.compile(r'^(0?[1-9]|1[0-2]):([0-5]?\d)\s*([AaPp])[Mm]$')
+# Class names of elements that might contain event information, for the fallback parser
+_SCHEDULE_CLASS_SELECTOR = ', '.join(
+    f'[class*="{name}" i]'
+    for name in ('event', 'schedule', 'booking', 'calendar', 'performance')
+)
+_UUID_RE = re.compile(r'[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}', re.IGNORECASE)
+
+# Raw HTML patterns for reading the booking items without building a DOM
+_BOOKING_DIV_RE = re.compile(r'<div\b[^>]*\bid=["\']div-booking-', re.IGNORECASE)
+_TIMES_LIST_RE = re.compile(r'<ul\b[^>]*\bclass=["\'](?:[^"\']*\s)?dash-bx-times(?:\s[^"\']*)?["\'][^>]*>(.*?)</ul>', re.IGNORECASE | re.DOTALL)
+_LI_RE = re.compile(r'<li\b([^>]*)>(.*?)</li>', re.IGNORECASE | re.DOTALL)
+_ADDRESS_CLASS_RE = re.compile(r'\bclass=["\'](?:[^"\']*\s)?address(?:\s[^"\']*)?["\']', re.IGNORECASE)
+_SPAN_RE = re.compile(r'<span\b[^>]*>(.*?)</span>', re.IGNORECASE | re.DOTALL)
+_LINK_RE = re.compile(r'<a\b[^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+_PROFILE_ALT_RE = re.compile(r'<img\b(?=[^>]*\bid=["\']profileImage["\'])[^>]*\balt=(["\'])(.*?)\1', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+# Markup whose text BeautifulSoup's get_text() leaves out
+_NON_TEXT_RE = re.compile(r'<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
+def _html_text(fragment: str) -> str:
+    """Get the text of an HTML fragment, like BeautifulSoup's get_text()."""
+    return html.unescape(_TAG_RE.sub('', fragment))
+
+def _page_text(content: str) -> str:
+    """Get the visible text of a whole page, like BeautifulSoup's get_text()."""
+    return html.unescape(_TAG_RE.sub('', _NON_TEXT_RE.sub('', content)))
+
+# Handle different date formats
+DATE_FORMATS = [
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+    '%m/%d/%Y',
+    '%d-%m-%Y',
+    '%B %d, %Y',
+    '%b %d, %Y',
+    '%d %B %Y',
+    '%d %b %Y'
+]
+
+# Removes control characters, keeping tab, newline and carriage return, and turns non-breaking spaces into spaces
+_CLEAN_TABLE = dict.fromkeys([*range(0x01, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), *range(0x7f, 0xa0)])
+_CLEAN_TABLE[0xa0] = ' '
+
+# Dates with a month name, converted without strptime
+_DAY_MONTH_NAME_YEAR_RE = re.compile(r'^(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})$')
+_MONTH_NAME_DAY_YEAR_RE = re.compile(r'^([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})$')
+_MONTH_NUMBERS = {
+    name.lower(): number
+    for number in range(1, 13)
+    for name in (calendar.month_name[number], calendar.month_abbr[number])
+}
+
+# Maps a date string's shape (digits as 9, letters as A) to the format that last parsed it
+_DATE_SHAPE_TABLE = str.maketrans('0123456789' + string.ascii_letters, '9' * 10 + 'A' * len(string.ascii_letters))
+_DATE_SHAPE_FORMATS = {}
+
+@lru_cache(maxsize=1024)
+def _parse_date_value(date_str: str) -> Optional[str]:
+    """Parse a date string into YYYY-MM-DD format, or None if no format matches."""
+    # Dispatch the common shapes straight to their fields instead of trying formats in turn
+    match = _ISO_DATE_RE.match(date_str)
+    if match:
+        year, month_number, day = map(int, match.groups())
+    else:
+        # "02 January 2026" and "January 2, 2026", with the month looked up directly
+        month_number = None
+        match = _DAY_MONTH_NAME_YEAR_RE.match(date_str)
+        if match:
+            day, month, year = match.groups()
+        else:
+            match = _MONTH_NAME_DAY_YEAR_RE.match(date_str)
+            if match:
+                month, day, year = match.groups()
+        if match:
+            month_number = _MONTH_NUMBERS.get(month.lower())
+            year, day = int(year), int(day)
+    if match and month_number:
+        try:
+            return datetime(year, month_number, day).strftime('%Y-%m-%d')
+        except ValueError:
+            return None
+    
+    shape = date_str.translate(_DATE_SHAPE_TABLE)
+    guess = _DATE_SHAPE_FORMATS.get(shape)
+    if guess:
+        try:
+            return datetime.strptime(date_str, guess).strftime('%Y-%m-%d')
+        except ValueError:
+            pass
+    
+    for fmt in DATE_FORMATS:
+        if fmt == guess:
+            continue
+        try:
+            date_obj = datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+        # '%m/%d/%Y' only applies when '%d/%m/%Y' rejects the day, so it can't stand in for its shape
+        if fmt != '%m/%d/%Y':
+            _DATE_SHAPE_FORMATS[shape] = fmt
+        return date_obj.strftime('%Y-%m-%d')
+    
+    return None
+
+@lru_cache(maxsize=1024)
+def _is_calendar_date(date_str: str) -> bool:
+    """Check that a YYYY-MM-DD string is a real day."""
+    try:
+        date.fromisoformat(date_str)
+        return True
+    except ValueError:
+        return False
+
+@lru_cache(maxsize=1024)
+def _normalize_time(time_str: str) -> Tuple[str, bool]:
+    """Normalize a time string to 24-hour HH:MM format, returning whether it could be parsed."""
+    # Handle formats like "7.30pm"
+    time_str = time_str.replace('.', ':')
+    
+    # Handle 12-hour format
+    lowered = time_str.lower()
+    if 'am' in lowered or 'pm' in lowered:
+        # Handle formats like "7pm", which have no minutes
+        match = _BARE_HOUR_MERIDIAN_RE.match(time_str)
+        if match:
+            hour = int(match.group(1)) % 12 + (12 if match.group(2) in 'Pp' else 0)
+            return f"{hour:02d}:00", True
+        
+        # Handle formats like "7:30pm" or "7:30 PM"
+        match = _TIME_12H_RE.match(time_str)
+        if not match:
+            return time_str, False
+        hour = int(match.group(1)) % 12 + (12 if match.group(3) in 'Pp' else 0)
+        return f"{hour:02d}:{int(match.group(2)):02d}", True
+    
+    # Handle 24-hour format
+    if ':' not in time_str:
+        # If no colon, assume it's like "1900" for 19:00
+        if len(time_str) == 4 and time_str.isdigit():
+            time_str = time_str[:2] + ':' + time_str[2:]
+        elif len(time_str) == 3 and time_str.isdigit():
+            time_str = time_str[0] + ':' + time_str[1:]
+    
+    # Validate 24-hour format
+    return time_str, bool(_TIME_24H_RE.match(time_str))
+
+def _is_booking_or_name_tag(name: str, attrs: dict) -> bool:
+    """Match the booking item divs and the tags the busker name is read from."""
+    if name == 'div':
+        return (attrs.get('id') or '').startswith('div-booking-')
+    if name == 'img':
+        return attrs.get('id') == 'profileImage'
+    return name in ('h2', 'span')
+
+# The booking item divs, without the result view container that holds them
+BOOKING_ITEMS_SELECTOR = 'div[id^="div-booking-"]:not(#div-booking-result-view)'
+BOOKING_ITEMS_PRESENT_JS = "selector => document.querySelectorAll(selector).length > 0"
+
+# Reads the booking items' fields in the page, in the same shape as the scraper's field readers,
+# and the busker name from the profile image alt or the first heading
+BOOKING_PAYLOAD_JS = """selector => {
+    const text = el => el ? el.textContent : null;
+    const items = Array.from(document.querySelectorAll(selector), item => {
+        const timesList = item.querySelector('ul.dash-bx-times');
+        if (!timesList) return null;
+        const addressLi = timesList.querySelector('li.address');
+        const profileImg = item.querySelector('img#profileImage');
+        return {
+            lis: Array.from(timesList.querySelectorAll('li'), text),
+            time: text(timesList.querySelector('span')),
+            address: text(addressLi),
+            address_link: text(addressLi && addressLi.querySelector('a')),
+            profile_alt: profileImg ? profileImg.getAttribute('alt') : null
+        };
+    });
+    const profileAlt = (document.querySelector('img#profileImage')?.getAttribute('alt') || '').trim();
+    const heading = (text(document.querySelector('h2')) || '').trim();
+    return {busker_name: profileAlt || (heading.length > 1 ? heading : null), items: items};
+}"""
+
+# How long to wait for the booking requests to finish once the first items have rendered, in milliseconds
+NETWORK_IDLE_TIMEOUT = 10000
+
+# Resource types the scraper's browser doesn't download, scripts are still needed to render the bookings
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+# Analytics and ad hosts whose scripts have nothing to do with the schedule, subdomains included
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "connect.facebook.net",
+    "hotjar.com",
+)
+
+def _is_blocked_request(request) -> bool:
+    """Check whether the scraper's browser should skip a request."""
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    host = urlparse(request.url).hostname or ''
+    return any(host == blocked or host.endswith('.' + blocked) for blocked in BLOCKED_HOSTS)
+
+# Limits tree construction to the parts of the page the booking item parser reads
+BOOKING_STRAINER = SoupStrainer(_is_booking_or_name_tag)
 
 class BuskerScraper:
     """Web scraper for busker schedules using Playwright."""
     
-    def __init__(self):
+    def __init__(self, browser_pool=None):
         self.logger = get_logger(__name__)
         self.url = Config.BUSKER_URL
         self.timeout = Config.PLAYWRIGHT_TIMEOUT
         self.headless = Config.PLAYWRIGHT_HEADLESS
+        # The browser stays warm between scrapes instead of being launched for each one
+        self.browser_pool = browser_pool or BrowserPool()
+    
+    def close(self):
+        """Shut down the scraper's browser."""
+        self.browser_pool.shutdown()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def scrape_busker_schedule(self) -> List[Dict[str, Any]]:
         """Scrape the busker schedule from the website."""
@@ -45,160 +309,93 @@ class BuskerScraper:
             
         # If alternative approach fails, use Playwright
         def scrape_attempt():
-            with sync_playwright() as p:
-                # Launch browser with specific executable path if available
-                # First, let's try to find where Playwright actually installed the browser
-                import subprocess
+            # The page is loaded in the pooled browser, then parsed on this thread
+            loaded = self.browser_pool.run(self._load_page)
+            
+            events = self._parse_loaded(loaded)
                 
-                # First, try system-installed browsers which are more reliable in container environments
-                # This is more reliable since we install them in the Dockerfile
-                self.logger.info("Attempting to launch system chromium-browser at /usr/bin/chromium-browser")
-                try:
-                    browser = p.chromium.launch(
-                        headless=self.headless,
-                        executable_path="/usr/bin/chromium-browser",
-                        args=[
-                            '--no-sandbox',
-                            '--disable-setuid-sandbox',
-                            '--disable-dev-shm-usage',
-                            '--disable-gpu',
-                            '--disable-extensions',
-                            '--disable-background-timer-throttling',
-                            '--disable-backgrounding-occluded-windows',
-                            '--disable-renderer-backgrounding',
-                            '--no-first-run',
-                            '--no-default-browser-check',
-                            '--disable-default-apps',
-                            '--disable-extensions',
-                            '--disable-plugins',
-                            '--disable-images',
-                            '--no-zygote'
-                        ]
-                    )
-                    self.logger.info("Successfully launched system chromium-browser")
-                except Exception as e:
-                    self.logger.warning(f"Failed to launch system chromium-browser: {e}")
-                    try:
-                        # Try another common location with args
-                        self.logger.info("Attempting to launch system chromium at /usr/bin/chromium")
-                        browser = p.chromium.launch(
-                            headless=self.headless,
-                            executable_path="/usr/bin/chromium",
-                            args=[
-                                '--no-sandbox',
-                                '--disable-setuid-sandbox',
-                                '--disable-dev-shm-usage',
-                                '--disable-gpu',
-                                '--disable-extensions',
-                                '--disable-background-timer-throttling',
-                                '--disable-backgrounding-occluded-windows',
-                                '--disable-renderer-backgrounding',
-                                '--no-first-run',
-                                '--no-default-browser-check',
-                                '--disable-default-apps',
-                                '--disable-extensions',
-                                '--disable-plugins',
-                                '--disable-images',
-                                '--no-zygote'
-                            ]
-                        )
-                        self.logger.info("Successfully launched system chromium")
-                    except Exception as e2:
-                        self.logger.warning(f"Failed to launch system chromium: {e2}")
-                        # If system browsers fail, try Playwright's default launch with proper path configuration
-                        self.logger.info("Attempting Playwright launch with direct browser path")
-                        browser = p.chromium.launch(
-                            headless=self.headless,
-                            args=[
-                                '--no-sandbox',
-                                '--disable-setuid-sandbox',
-                                '--disable-dev-shm-usage',
-                                '--disable-gpu',
-                                '--disable-extensions',
-                                '--disable-background-timer-throttling',
-                                '--disable-backgrounding-occluded-windows',
-                                '--disable-renderer-backgrounding',
-                                '--no-first-run',
-                                '--no-default-browser-check',
-                                '--disable-default-apps',
-                                '--disable-extensions',
-                                '--disable-plugins',
-                                '--disable-images',
-                                '--no-zygote'
-                            ]
-                        )
-                        self.logger.info("Successfully launched browser using Playwright")
-                page = browser.new_page()
-                    
-                try:
-                    # Navigate to the page
-                    page.goto(self.url, timeout=self.timeout)
-                    self.logger.info("Page loaded successfully")
-                        
-                    # Wait for the booking content to load (it's loaded dynamically)
-                    try:
-                        # Wait for the main booking container to load
-                        page.wait_for_selector('#div-booking-result-view', timeout=30000)
-                        self.logger.info("Booking result view loaded")
-                            
-                        # Wait additional time for all booking items to populate
-                        page.wait_for_timeout(20000)
-                            
-                        # Verify booking items are loaded by checking for booking divs
-                        booking_items = page.query_selector_all('[id^="div-booking-"]')
-                        if booking_items:
-                            self.logger.info(f"Found {len(booking_items)} booking items")
-                        else:
-                            self.logger.warning("No booking items found after waiting")
-                                
-                        # Scroll to load all content
-                        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                        page.wait_for_timeout(5000)
-                            
-                    except PlaywrightTimeoutError:
-                        self.logger.warning("Booking content didn't load within timeout, continuing with available content")
-                        
-                    # Get the page content after JavaScript execution
-                    content = page.content()
-                        
-                    # Close browser
-                    browser.close()
-                        
-                    # Parse the content with BeautifulSoup
-                    soup = BeautifulSoup(content, 'html.parser')
-                        
-                    # Extract the busker name from the page
-                    busker_name = self._extract_busker_name(soup)
-                        
-                    events = self._parse_schedule(soup)
-                        
-                    # Update all events with the busker name
-                    for event in events:
-                        event['busker_name'] = busker_name
-                        
-                    self.logger.info(f"Successfully scraped {len(events)} events")
-                    return events
-                        
-                except PlaywrightTimeoutError:
-                    browser.close()
-                    self.logger.error(f"Timeout while scraping {self.url}")
-                    raise
-                except Exception as e:
-                    # Ensure browser is closed even if an exception occurs
-                    try:
-                        browser.close()
-                    except:
-                        pass  # Ignore errors when closing browser
-                    self.logger.error(f"Error during scraping: {e}")
-                    raise
+            self.logger.info(f"Successfully scraped {len(events)} events")
+            return events
             
+        def scrape_with_retries():
+            return retry_with_backoff(scrape_attempt, max_retries=Config.MAX_RETRIES, delay=Config.RETRY_DELAY)
+        
         # Use retry logic for scraping
         try:
-            return retry_with_backoff(scrape_attempt, max_retries=Config.MAX_RETRIES, delay=Config.RETRY_DELAY)
+            if Config.BUSKER_PROFILE:
+                # Page loads run on the browser thread, so the profile shows them as waits and breaks down the parsing
+                return profile_call(scrape_with_retries, self.logger)
+            return scrape_with_retries()
         except Exception as e:
             self.logger.error(f"Failed to scrape after {Config.MAX_RETRIES} attempts: {e}")
             raise
         
+    def _load_page(self, page) -> Union[str, Dict[str, Any]]:
+        """Load the busker page and return its booking items' text, or its HTML if there are none."""
+        try:
+            # Only the DOM is parsed, so don't download images, fonts, media or stylesheets
+            page.route("**/*", self._route_request)
+            
+            # Navigate to the page
+            # The booking items are waited for below, so don't also wait for every subresource
+            page.goto(self.url, wait_until='domcontentloaded', timeout=self.timeout)
+            self.logger.info("Page loaded successfully")
+                
+            # Wait for the booking content to load (it's loaded dynamically)
+            try:
+                # Wait for the main booking container to load, only its markup is read so it needn't be visible
+                page.wait_for_selector('#div-booking-result-view', state='attached', timeout=self.timeout)
+                self.logger.info("Booking result view loaded")
+                    
+                # Wait for the first booking items, then for the requests filling in the rest to finish
+                page.wait_for_function(BOOKING_ITEMS_PRESENT_JS, arg=BOOKING_ITEMS_SELECTOR, timeout=self.timeout)
+                self._wait_for_network_idle(page)
+                    
+                # Verify booking items are loaded by counting the booking divs in one call
+                booking_count = page.locator(BOOKING_ITEMS_SELECTOR).count()
+                if booking_count:
+                    self.logger.info(f"Found {booking_count} booking items")
+                else:
+                    self.logger.warning("No booking items found after waiting")
+                        
+                # Scroll to load all content
+                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                self._wait_for_network_idle(page)
+                    
+            except PlaywrightTimeoutError:
+                self.logger.warning("Booking content didn't load within timeout, continuing with available content")
+                
+            # Read the booking items' text in the browser instead of sending their markup back to be parsed
+            payload = page.evaluate(BOOKING_PAYLOAD_JS, BOOKING_ITEMS_SELECTOR)
+            # Items without a times list come back as null and can't be parsed
+            payload['items'] = [item for item in payload['items'] if item]
+            if payload['items']:
+                return payload
+            
+            # Without booking items the fallback parsers need the whole page after JavaScript execution
+            return page.content()
+                
+        except PlaywrightTimeoutError:
+            self.logger.error(f"Timeout while scraping {self.url}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Error during scraping: {e}")
+            raise
+    
+    def _wait_for_network_idle(self, page):
+        """Wait for the page's network traffic to settle, carrying on if it never does."""
+        try:
+            page.wait_for_load_state('networkidle', timeout=NETWORK_IDLE_TIMEOUT)
+        except PlaywrightTimeoutError:
+            self.logger.debug("Network didn't go idle, continuing with the loaded content")
+    
+    def _route_request(self, route):
+        """Abort requests for resources the schedule parsing doesn't need."""
+        if _is_blocked_request(route.request):
+            route.abort()
+        else:
+            route.continue_()
+    
     def _scrape_with_requests(self) -> List[Dict[str, Any]]:
         """Alternative scraping method using requests and BeautifulSoup."""
         self.logger.info("Attempting to scrape using requests approach")
@@ -210,120 +407,185 @@ class BuskerScraper:
         response = requests.get(self.url, headers=headers, timeout=30)
         content = response.text
             
-        # Parse the content with BeautifulSoup
-        soup = BeautifulSoup(content, 'html.parser')
-            
-        # Extract the busker name from the page
-        busker_name = self._extract_busker_name(soup)
+        events = self._parse_content(content)
             
-        events = self._parse_schedule(soup)
-            
-        # Update all events with the busker name
+        self.logger.info(f"Scraped {len(events)} events using requests approach")
+        return events
+    
+    def _parse_loaded(self, loaded: Union[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Parse the events from what a page load returned, the booking items' text or the page HTML."""
+        if isinstance(loaded, str):
+            return self._parse_content(loaded)
+        
+        # The fields were already read in the browser
+        events = self._extract_booking_events(loaded['items'], lambda fields: fields)
+        return self._tag_events(events, loaded['busker_name'] or "Unknown Busker")
+    
+    def _parse_content(self, content: str) -> List[Dict[str, Any]]:
+        """Parse the events from the page HTML and tag them with the busker name, ID and scrape time."""
+        # Fast path: read the known booking item markup straight from the HTML
+        events = self._parse_booking_html(content)
+        profile_alt = _PROFILE_ALT_RE.search(content)
+        if events and profile_alt and profile_alt.group(2).strip():
+            busker_name = html.unescape(profile_alt.group(2)).strip()
+        elif SELECTOLAX_AVAILABLE:
+            # Read the booking items with lexbor, which is much faster than building a soup
+            tree = LexborHTMLParser(content)
+            booking_items = tree.css(BOOKING_ITEMS_SELECTOR)
+            events = self._extract_booking_events(booking_items, self._lexbor_booking_item_fields)
+            if events:
+                busker_name = self._extract_busker_name_lexbor(tree)
+        else:
+            # Only build the booking items and busker name candidates, skipping the rest of the page
+            soup = BeautifulSoup(content, 'lxml', parse_only=BOOKING_STRAINER)
+            events = self._parse_booking_items(soup)
+            if events:
+                busker_name = self._extract_busker_name(soup)
+        
+        # The fallback parsers need the whole page
+        if not events:
+            soup = BeautifulSoup(content, 'lxml')
+            events = self._parse_schedule(soup, content)
+            busker_name = self._extract_busker_name(soup)
+        
+        return self._tag_events(events, busker_name)
+    
+    def _tag_events(self, events: List[Dict[str, Any]], busker_name: str) -> List[Dict[str, Any]]:
+        """Tag the events with the busker name, the busker ID and one scrape timestamp."""
+        busker_id = self._extract_busker_id(self.url)
+        # Naive local time, the format readers of scraped_at expect
+        scraped_at = datetime.now().isoformat()
         for event in events:
             event['busker_name'] = busker_name
-            
-        self.logger.info(f"Scraped {len(events)} events using requests approach")
+            event['busker_id'] = busker_id
+            event['scraped_at'] = scraped_at
+        
         return events
     
-    def _parse_schedule(self, soup) -> List[Dict[str, Any]]:
-        """Parse the schedule from the BeautifulSoup object."""
+    def _parse_booking_html(self, content: str) -> List[Dict[str, Any]]:
+        """Parse events from the booking item divs in the raw HTML, without a DOM."""
+        # Each item runs from its opening div to the next item's opening div
+        starts = [match.start() for match in _BOOKING_DIV_RE.finditer(content)]
+        booking_items = [content[start:end] for start, end in zip(starts, starts[1:] + [len(content)])]
+        return self._extract_booking_events(booking_items, self._regex_booking_item_fields)
+    
+    def _parse_booking_items(self, soup) -> List[Dict[str, Any]]:
+        """Parse events from the booking item divs of a BeautifulSoup object."""
+        # The booking items are in divs with IDs like 'div-booking-[uuid]', matched by prefix without a regex
+        booking_items = soup.select(BOOKING_ITEMS_SELECTOR)
+        return self._extract_booking_events(booking_items, self._booking_item_fields)
+    
+    def _extract_booking_events(self, booking_items, read_fields: Callable) -> List[Dict[str, Any]]:
+        """Extract the events from a list of booking item divs."""
         events = []
         
-        # Look for booking items specifically
-        # The booking items are in divs with IDs like 'div-booking-[uuid]'
-        booking_items = soup.find_all('div', id=re.compile(r'^div-booking-'))
-        
         if booking_items:
             self.logger.info(f"Found {len(booking_items)} booking items")
             
             for item in booking_items:
-                event = self._extract_event_from_booking_item(item)
+                event = self._extract_event_from_booking_item(item, read_fields)
                 if event:
                     events.append(event)
         
-        # If no events found from booking items, try the original approach
-        if not events:
-            # Look for elements that might contain event information
-            # Try various selectors that might match the actual page structure
-            possible_selectors = [
-                '[class*="event"]',
-                '[class*="schedule"]',
-                '[class*="booking"]',
-                '[class*="calendar"]',
-                '[class*="performance"]',
-                '.event',
-                '.schedule',
-                '.booking',
-                '.calendar',
-                '.performance'
-            ]
-            
-            schedule_items = []
-            
-            # Try to find elements using different selectors
-            for selector in possible_selectors:
-                if selector.startswith('.'):
-                    # Handle class selectors
-                    class_name = selector[1:]
-                    items = soup.find_all(class_=re.compile(f'.*{class_name}.*', re.IGNORECASE))
-                    schedule_items.extend(items)
-                elif selector.startswith('['):
-                    # Handle attribute selectors
-                    if 'class*=' in selector:
-                        search_term = selector.split('class*=')[1].strip('\"\'\'')
-                        items = soup.find_all(class_=re.compile(f'.*{search_term}.*', re.IGNORECASE))
-                        schedule_items.extend(items)
-                    elif 'data-testid' in selector:
-                        attr_parts = selector[1:-1].split('=')
-                        if len(attr_parts) == 2:
-                            attr_name = attr_parts[0]
-                            attr_value = attr_parts[1].strip('\"\'\'')
-                            items = soup.find_all(attrs={attr_name: attr_value})
-                            schedule_items.extend(items)
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_items = []
-            for item in schedule_items:
-                if item not in seen:
-                    seen.add(item)
-                    unique_items.append(item)
-            
-            schedule_items = unique_items
-            
-            if schedule_items:
-                self.logger.info(f"Found {len(schedule_items)} potential schedule items")
-                
-                for item in schedule_items:
-                    event = self._extract_event_from_item(item)
-                    if event:
-                        events.append(event)
+        return events
+    
+    def _parse_schedule(self, soup, content: str) -> List[Dict[str, Any]]:
+        """Parse the schedule from the BeautifulSoup object, falling back to the page text."""
+        # Look for booking items specifically
+        events = self._parse_booking_items(soup)
+        if events:
+            return events
+        
+        # Otherwise look for elements whose class names suggest they hold event information,
+        # in one walk of the tree that returns each element once, in document order
+        schedule_items = soup.select(_SCHEDULE_CLASS_SELECTOR)
+        
+        if schedule_items:
+            self.logger.info(f"Found {len(schedule_items)} potential schedule items")
+            
+            extracted = (self._extract_event_from_item(item) for item in schedule_items)
+            events = [event for event in extracted if event]
         
         # If no events found from structured elements, try text-based parsing as a fallback
         if not events:
             self.logger.info("No events extracted from structured elements, using text-based extraction")
-            events = self._parse_by_text_content(soup)
+            events = self._parse_by_text_content(content)
         
         return events
     
-    def _extract_event_from_booking_item(self, item) -> Optional[Dict[str, Any]]:
-        """Extract event details from a booking item div."""
+    def _booking_item_fields(self, item) -> Optional[Dict[str, Any]]:
+        """Read the raw text of a BeautifulSoup booking item div."""
+        # The booking item has a specific structure with ul.dash-bx-times
+        # containing date, time, and location in separate li elements
+        times_list = item.find('ul', class_='dash-bx-times')
+        if not times_list:
+            return None
+        
+        time_span = times_list.find('span')
+        address_li = times_list.find('li', class_='address')
+        location_link = address_li.find('a') if address_li else None
+        profile_img = item.find('img', id='profileImage')
+        return {
+            'lis': [li.get_text() for li in times_list.find_all('li')],
+            'time': time_span.get_text() if time_span else None,
+            'address': address_li.get_text() if address_li else None,
+            'address_link': location_link.get_text() if location_link else None,
+            'profile_alt': profile_img.get('alt') if profile_img else None
+        }
+    
+    def _regex_booking_item_fields(self, item: str) -> Optional[Dict[str, Any]]:
+        """Read the raw text of a booking item from its HTML."""
+        times_list = _TIMES_LIST_RE.search(item)
+        if not times_list:
+            return None
+        
+        times_html = times_list.group(1)
+        lis = _LI_RE.findall(times_html)
+        time_span = _SPAN_RE.search(times_html)
+        address_li = next((inner for attrs, inner in lis if _ADDRESS_CLASS_RE.search(attrs)), None)
+        location_link = _LINK_RE.search(address_li) if address_li is not None else None
+        profile_alt = _PROFILE_ALT_RE.search(item)
+        return {
+            'lis': [_html_text(inner) for attrs, inner in lis],
+            'time': _html_text(time_span.group(1)) if time_span else None,
+            'address': _html_text(address_li) if address_li is not None else None,
+            'address_link': _html_text(location_link.group(1)) if location_link else None,
+            'profile_alt': html.unescape(profile_alt.group(2)) if profile_alt else None
+        }
+    
+    def _lexbor_booking_item_fields(self, item) -> Optional[Dict[str, Any]]:
+        """Read the raw text of a selectolax booking item node."""
+        times_list = item.css_first('ul.dash-bx-times')
+        if not times_list:
+            return None
+        
+        time_span = times_list.css_first('span')
+        address_li = times_list.css_first('li.address')
+        location_link = address_li.css_first('a') if address_li else None
+        profile_img = item.css_first('img#profileImage')
+        return {
+            'lis': [li.text() for li in times_list.css('li')],
+            'time': time_span.text() if time_span else None,
+            'address': address_li.text() if address_li else None,
+            'address_link': location_link.text() if location_link else None,
+            'profile_alt': profile_img.attributes.get('alt') if profile_img else None
+        }
+    
+    def _extract_event_from_booking_item(self, item, read_fields: Callable) -> Optional[Dict[str, Any]]:
+        """Extract event details from a booking item div, read with the parser's field reader."""
         try:
-            # The booking item has a specific structure with ul.dash-bx-times
-            # containing date, time, and location in separate li elements
-            times_list = item.find('ul', class_='dash-bx-times')
-            if not times_list:
+            fields = read_fields(item)
+            if not fields:
                 self.logger.debug("No dash-bx-times list found in booking item")
                 return None
             
             # Extract date from the li that contains the date pattern
             date_str = None
-            all_lis = times_list.find_all('li')
-            for li in all_lis:
-                li_text = li.get_text().strip()
-                if re.search(r'[A-Za-z]{3},\s*\d{2}\s+\w+', li_text):
+            for li_text in fields['lis']:
+                li_text = li_text.strip()
+                if _BOOKING_DATE_RE.search(li_text):
                     # Extract the date part: "Fri, 02 January" -> "02 January"
-                    date_match = re.search(r'(\d{2}\s+\w+)', li_text)
+                    date_match = _DAY_MONTH_RE.search(li_text)
                     if date_match:
                         # Since year is not in the date string, use current year
                         current_year = datetime.now().year
@@ -334,73 +596,55 @@ class BuskerScraper:
             start_time = None
             end_time = None
             
-            # Find the li element containing the time span
-            time_spans = times_list.find_all('span')
-            if time_spans:
-                time_text = time_spans[0].get_text().strip()
-                # Clean the text to remove any special characters including non-breaking spaces
-                time_text = time_text.replace('\xa0', ' ')  # Replace non-breaking space with regular space
-                # Remove only specific unwanted control characters, preserve useful ones
-                # Keep: space(32), tab(9), newline(10), carriage return(13)
-                # Remove: other control characters
-                time_text = re.sub(r'[\x01-\x08\x0b\x0c\x0e-\x1f\x7f\x80-\x9f]+', '', time_text)  # Remove unwanted control chars
+            # Read the first time span
+            if fields['time'] is not None:
+                # Clean the text of control characters and non-breaking spaces in one pass
+                time_text = fields['time'].strip().translate(_CLEAN_TABLE)
                 
                 # Look for time range pattern
-                time_range_match = re.search(r'(\d{1,2}:\d{2}:[AaPp][Mm])\s*[-–]\s*(\d{1,2}:\d{2}:[AaPp][Mm])', time_text)
+                time_range_match = _BOOKING_TIME_RANGE_RE.search(time_text)
                 if time_range_match:
                     start_time_raw = time_range_match.group(1)
                     end_time_raw = time_range_match.group(2)
                     
                     # Normalize time format (convert 10:00:AM to 10:00 AM)
-                    start_time = re.sub(r':([AaPp][Mm])', r' \1', start_time_raw)
-                    end_time = re.sub(r':([AaPp][Mm])', r' \1', end_time_raw)
+                    start_time = _MERIDIAN_SUFFIX_RE.sub(r' \1', start_time_raw)
+                    end_time = _MERIDIAN_SUFFIX_RE.sub(r' \1', end_time_raw)
                     
                     start_time = self._normalize_time_format(start_time)
                     end_time = self._normalize_time_format(end_time)
             
             # Extract location from the li with class 'address'
             location = "Unknown Location"
-            address_li = times_list.find('li', class_='address')
-            if address_li:
-                location_link = address_li.find('a')
-                if location_link:
+            if fields['address'] is not None:
+                if fields['address_link'] is not None:
                     # Get text after the image tag
-                    location_text = location_link.get_text().strip()
-                    # Clean the text to remove special characters
-                    location_text = re.sub(r'[\x01-\x08\x0b\x0c\x0e-\x1f\x7f\x80-\x9f]+', '', location_text)  # Remove unwanted control chars
-                    # Extract just the location part (after the image alt text)
-                    # Handle both &nbsp; and non-breaking space (\xa0)
-                    location_text = location_text.replace('&nbsp;', ' ')
-                    location_text = location_text.replace('\xa0', ' ')  # Replace non-breaking space with regular space
+                    # Clean the text of control characters and both &nbsp; and non-breaking spaces
+                    location_text = fields['address_link'].strip().translate(_CLEAN_TABLE).replace('&nbsp;', ' ')
                                 
                     # Find the location text (usually the last significant part)
-                    loc_match = re.search(r'[\w\s,\.\(\)-]+$', location_text.strip())
+                    loc_match = _TRAILING_LOCATION_RE.search(location_text.strip())
                     if loc_match:
                         location = loc_match.group(0).strip()
                 else:
-                    location = address_li.get_text().strip()
-                    # Clean the text to remove special characters
-                    location = re.sub(r'[\x01-\x08\x0b\x0c\x0e-\x1f\x7f\x80-\x9f]+', '', location).strip()
-                    location = location.replace('&nbsp;', ' ').replace('\xa0', ' ').strip()  # Handle non-breaking spaces
+                    # Clean the text of control characters and both &nbsp; and non-breaking spaces
+                    location = fields['address'].translate(_CLEAN_TABLE).replace('&nbsp;', ' ').strip()
             
             # Validate we have the required information
             if date_str and start_time and end_time and location:
                 date = self._parse_date(date_str)
                 
                 # Extract busker name from the profile image alt attribute
-                profile_img = item.find('img', id='profileImage')
                 busker_name = "Unknown Busker"
-                if profile_img and profile_img.get('alt'):
-                    busker_name = profile_img.get('alt').strip()
+                if fields['profile_alt']:
+                    busker_name = fields['profile_alt'].strip()
                 
                 event = {
                     'date': date,
                     'start_time': start_time,
                     'end_time': end_time,
                     'location': location,
-                    'busker_name': busker_name,
-                    'busker_id': self._extract_busker_id(self.url),
-                    'scraped_at': datetime.now().isoformat()
+                    'busker_name': busker_name
                 }
                 
                 # Validate that we have essential fields
@@ -446,94 +690,98 @@ class BuskerScraper:
             self.logger.warning(f"Error extracting busker name: {e}")
             return "Unknown Busker"
     
+    def _extract_busker_name_lexbor(self, tree) -> str:
+        """Extract the busker name from a selectolax tree."""
+        try:
+            # Same lookup order as _extract_busker_name
+            profile_img = tree.css_first('img#profileImage')
+            if profile_img and profile_img.attributes.get('alt'):
+                return profile_img.attributes.get('alt').strip()
+            
+            h2_tag = tree.css_first('h2')
+            if h2_tag:
+                h2_text = h2_tag.text().strip()
+                if h2_text and len(h2_text) > 1:
+                    return h2_text
+            
+            for span in tree.css('span'):
+                span_text = span.text().strip()
+                if len(span_text) > 5 and not span_text.lower().startswith('location'):
+                    return span_text
+            
+            return "Unknown Busker"
+            
+        except Exception as e:
+            self.logger.warning(f"Error extracting busker name: {e}")
+            return "Unknown Busker"
+    
+    def _element_texts(self, item) -> List[str]:
+        """Get the stripped text of each element in a schedule item that might hold a field."""
+        return [tag.get_text().strip() for tag in item.find_all(['span', 'div', 'p', 'li', 'td'])]
+    
     def _extract_event_from_item(self, item) -> Optional[Dict[str, Any]]:
         """Extract event details from a single schedule item."""
         try:
+            # Walk the item's strings once and look for every field in that list
+            texts = list(item.stripped_strings)
+            # Text of each element, for fields split across strings, built at most once and only when needed
+            element_texts = None
+            
             # Look for date - common patterns
-            date_elements = item.find_all(text=re.compile(r'\d{4}-\d{2}-\d{2}')) or \
-                           item.find_all(text=re.compile(r'\d{1,2}/\d{1,2}/\d{4}')) or \
-                           item.find_all(text=re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec).*\d{1,2}.*\d{4}'))
+            date_text = next((text for text in texts if _ANY_DATE_RE.search(text)), None)
             
-            if date_elements:
-                date_text = str(date_elements[0]).strip()
+            if date_text:
                 date = self._parse_date(date_text)
             else:
-                # Try to find date in child elements
-                date_elem = item.find(['span', 'div', 'p'], text=re.compile(r'\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}|(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec).*\d{1,2}.*\d{4}'))
-                if date_elem:
-                    date = self._parse_date(str(date_elem.text).strip())
-                else:
-                    # Try to find date by looking for elements with date-like content
-                    # Look for elements with date pattern
-                    for tag in item.find_all(['span', 'div', 'p', 'li', 'td']):
-                        text_content = tag.get_text().strip()
-                        if re.search(r'\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}|(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec).*\d{1,2}.*\d{4}', text_content, re.IGNORECASE):
-                            date = self._parse_date(text_content)
-                            break
-                    else:
-                        # Could not find date, skip this item
-                        return None
+                # Try to find date by looking for elements with date-like content split across strings
+                element_texts = self._element_texts(item)
+                date_text = next((text for text in element_texts if _ANY_DATE_IGNORECASE_RE.search(text)), None)
+                if not date_text:
+                    # Could not find date, skip this item
+                    return None
+                date = self._parse_date(date_text)
             
             # Look for time - common patterns
-            time_elements = item.find_all(text=re.compile(r'\d{1,2}:\d{2}\s*(AM|PM|am|pm)?')) or \
-                           item.find_all(text=re.compile(r'\d{1,2}\.\d{2}'))  # For formats like 7.30pm
+            time_text = next((text for text in texts if _ANY_TIME_RE.search(text)), None)
             
-            if time_elements:
-                time_text = str(time_elements[0]).strip()
+            if time_text:
                 start_time, end_time = self._parse_time_range(time_text)
             else:
-                # Try to find time in child elements
-                time_elem = item.find(['span', 'div', 'p', 'li', 'td'], text=re.compile(r'\d{1,2}:\d{2}\s*(AM|PM|am|pm)?|\d{1,2}\.\d{2}'))
-                if time_elem:
-                    start_time, end_time = self._parse_time_range(str(time_elem.text).strip())
-                else:
-                    # Try to find time by looking for elements with time-like content
-                    for tag in item.find_all(['span', 'div', 'p', 'li', 'td']):
-                        text_content = tag.get_text().strip()
-                        if re.search(r'\d{1,2}:\d{2}\s*(AM|PM|am|pm)?|\d{1,2}\.\d{2}', text_content, re.IGNORECASE):
-                            start_time, end_time = self._parse_time_range(text_content)
-                            break
-                    else:
-                        # Could not find time, skip this item
-                        return None
+                # Try to find time by looking for elements with time-like content split across strings
+                if element_texts is None:
+                    element_texts = self._element_texts(item)
+                time_text = next((text for text in element_texts if _ANY_TIME_RE.search(text)), None)
+                if not time_text:
+                    # Could not find time, skip this item
+                    return None
+                start_time, end_time = self._parse_time_range(time_text)
             
             # Look for location - try multiple approaches
             location = "Unknown Location"
             
-            # First, look for location-related text
-            location_elements = item.find_all(['span', 'div', 'p', 'li', 'td'], text=re.compile(r'location|venue|@|at|\bat\b|\bpark\b|\btheatre\b|\bstreet\b|\bplaza\b', re.IGNORECASE))
-            if location_elements:
-                location = str(location_elements[0]).strip()
-            else:
-                # Look for elements that might contain location information
-                for tag in item.find_all(['span', 'div', 'p', 'li', 'td']):
-                    text_content = tag.get_text().strip()
-                    # Look for text that might be a location (contains capital words, Singapore, or address-like patterns)
-                    if re.search(r'[A-Z][a-z]+.*[A-Z][a-z]+|.*Singapore|.*St\.?|.*Ave\.?|.*Rd\.?|.*Lane|.*Circle|.*Plaza|.*Park|.*Theatre|.*Center|.*Centre', text_content, re.IGNORECASE):
-                        location = text_content
-                        break
+            # First, look for location-related text, then for text that might be a location
+            # (contains capital words, Singapore, or address-like patterns)
+            location_text = next((text for text in texts if _LOCATION_HINT_RE.search(text)), None) or \
+                            next((text for text in texts if _LOCATION_LIKE_RE.search(text)), None)
+            if location_text:
+                location = location_text
             
             # Clean up location text
-            location = re.sub(r'location[:\s]*|venue[:\s]*|@|at[:\s]*', '', location, flags=re.IGNORECASE).strip()
+            location = _LOCATION_PREFIX_RE.sub('', location).strip()
             
             # Look for busker name
             busker_name = "Unknown Busker"
             
             # Look for text that might be a name
-            name_elem = item.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'span', 'div', 'p', 'strong', 'b'], 
-                                 text=re.compile(r'busker|performer|artist|musician|band|singer|guitarist|violinist', re.IGNORECASE))
-            if name_elem:
-                busker_name = str(name_elem.text).strip()
+            name_text = next((text for text in texts if _PERFORMER_RE.search(text)), None)
+            if name_text:
                 # Remove performer-related terms
-                busker_name = re.sub(r'busker|performer|artist|musician|band|singer|guitarist|violinist', '', busker_name, flags=re.IGNORECASE).strip()
+                busker_name = _PERFORMER_RE.sub('', name_text).strip()
             else:
                 # Try to find the first significant text content as the name
-                all_text = item.get_text().strip()
-                lines = all_text.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    if line and len(line) > 2 and not re.match(r'\d.*\d|.*\d{4}.*|.*\d{1,2}:\d{2}.*', line):  # Skip if it looks like a date or time
-                        busker_name = line
+                for text in texts:
+                    if len(text) > 2 and not _DATE_OR_TIME_LINE_RE.match(text):  # Skip if it looks like a date or time
+                        busker_name = text
                         break
             
             # Create event object
@@ -542,9 +790,7 @@ class BuskerScraper:
                 'start_time': start_time,
                 'end_time': end_time,
                 'location': location,
-                'busker_name': busker_name,
-                'busker_id': self._extract_busker_id(self.url),  # Extract from URL
-                'scraped_at': datetime.now().isoformat()
+                'busker_name': busker_name
             }
             
             # Validate that we have essential fields
@@ -558,18 +804,15 @@ class BuskerScraper:
             self.logger.warning(f"Error extracting event from item: {e}")
             return None
     
-    def _parse_by_text_content(self, soup) -> List[Dict[str, Any]]:
-        """Parse schedule by looking for date/time patterns in the text."""
+    def _parse_by_text_content(self, content: str) -> List[Dict[str, Any]]:
+        """Parse schedule by looking for date/time patterns in the page text."""
         events = []
         
-        # Get all text content
-        text_content = soup.get_text()
+        # Get all text content straight from the HTML rather than walking the DOM
+        text_content = _page_text(content)
         
-        # Enhanced pattern to match the format you mentioned: "Fri, 02 January 06:00:PM - 07:00:PM HOUGANG CENTRAL HUB"
         # Pattern: Day, date Month Year time - time Location
-        event_pattern = r'([A-Za-z]{3}, \d{2} \w+ \d{4})\s+(\d{1,2}:\d{2})\s*([AaPp][Mm])\s*-\s*(\d{1,2}:\d{2})\s*([AaPp][Mm])\s+([A-Z\s]+)'
-        
-        matches = re.finditer(event_pattern, text_content)
+        matches = _EVENT_LINE_RE.finditer(text_content)
         for match in matches:
             date_part = match.group(1)  # "Fri, 02 January 2024"
             start_time = f"{match.group(2)} {match.group(3)}"  # "06:00 PM"
@@ -577,7 +820,7 @@ class BuskerScraper:
             location = match.group(6).strip()  # "HOUGANG CENTRAL HUB"
             
             # Extract just the date part to parse
-            date_str = re.search(r'(\d{2} \w+ \d{4})', date_part)
+            date_str = _DAY_MONTH_YEAR_RE.search(date_part)
             if date_str:
                 parsed_date = self._parse_date(date_str.group(1))
                 parsed_start_time = self._normalize_time_format(start_time)
@@ -588,54 +831,40 @@ class BuskerScraper:
                     'start_time': parsed_start_time,
                     'end_time': parsed_end_time,
                     'location': location,
-                    'busker_name': "Unknown Busker",
-                    'busker_id': self._extract_busker_id(self.url),
-                    'scraped_at': datetime.now().isoformat()
+                    'busker_name': "Unknown Busker"
                 }
                 
                 events.append(event)
         
         # If the specific format wasn't found, fall back to the original method
         if not events:
-            # Find date patterns
-            date_patterns = [
-                r'(\d{4}-\d{2}-\d{2})',
-                r'(\d{1,2}/\d{1,2}/\d{4})',
-                r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{4})',
-                r'(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4})'
-            ]
-            
-            for pattern in date_patterns:
-                matches = re.finditer(pattern, text_content, re.IGNORECASE)
-                for match in matches:
-                    date_str = match.group(1)
-                    parsed_date = self._parse_date(date_str)
+            # Find date patterns, all formats in one pass
+            for match in _TEXT_DATE_RE.finditer(text_content):
+                date_str = match.group()
+                parsed_date = self._parse_date(date_str)
+                
+                # Look for time near this date, bounding the searches rather than slicing out the context
+                start_pos = max(0, match.start() - 200)
+                end_pos = min(len(text_content), match.end() + 200)
+                
+                # Find time patterns in context
+                time_match = _TEXT_TIME_RE.search(text_content, start_pos, end_pos)
+                if time_match:
+                    start_time, end_time = self._parse_time_range(time_match.group(1))
                     
-                    # Look for time near this date
-                    start_pos = max(0, match.start() - 200)
-                    end_pos = min(len(text_content), match.end() + 200)
-                    context = text_content[start_pos:end_pos]
+                    # Look for location in context
+                    location_match = _TEXT_LOCATION_RE.search(text_content, start_pos, end_pos)
+                    location = location_match.group(1) or location_match.group(2) if location_match else "Unknown Location"
                     
-                    # Find time patterns in context
-                    time_matches = re.findall(r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?)', context)
-                    if time_matches:
-                        start_time, end_time = self._parse_time_range(time_matches[0])
-                        
-                        # Look for location in context
-                        location_match = re.search(r'at\s+([A-Z][^,.\n]{10,50})|@([A-Z][^,.\n]{10,50})', context, re.IGNORECASE)
-                        location = location_match.group(1) or location_match.group(2) if location_match else "Unknown Location"
-                        
-                        event = {
-                            'date': parsed_date,
-                            'start_time': start_time,
-                            'end_time': end_time,
-                            'location': location.strip(),
-                            'busker_name': "Unknown Busker",
-                            'busker_id': self._extract_busker_id(self.url),
-                            'scraped_at': datetime.now().isoformat()
-                        }
-                        
-                        events.append(event)
+                    event = {
+                        'date': parsed_date,
+                        'start_time': start_time,
+                        'end_time': end_time,
+                        'location': location.strip(),
+                        'busker_name': "Unknown Busker"
+                    }
+                    
+                    events.append(event)
         
         return events
     
@@ -643,24 +872,9 @@ class BuskerScraper:
         """Parse date string into YYYY-MM-DD format."""
         date_str = date_str.strip()
         
-        # Handle different date formats
-        formats = [
-            '%Y-%m-%d',
-            '%d/%m/%Y',
-            '%m/%d/%Y',
-            '%d-%m-%Y',
-            '%B %d, %Y',
-            '%b %d, %Y',
-            '%d %B %Y',
-            '%d %b %Y'
-        ]
-        
-        for fmt in formats:
-            try:
-                date_obj = datetime.strptime(date_str, fmt)
-                return date_obj.strftime('%Y-%m-%d')
-            except ValueError:
-                continue
+        parsed_date = _parse_date_value(date_str)
+        if parsed_date:
+            return parsed_date
         
         # If no format matches, return the original string
         self.logger.warning(f"Could not parse date: {date_str}")
@@ -671,8 +885,7 @@ class BuskerScraper:
         time_str = time_str.strip()
         
         # Handle time ranges like "7:30pm - 9:30pm" or "7.30pm to 9.30pm"
-        range_pattern = r'(\d{1,2}[:\.]\d{2}\s*(?:AM|PM|am|pm)?)\s*[-–to]+\s*(\d{1,2}[:\.]\d{2}\s*(?:AM|PM|am|pm)?)'
-        range_match = re.match(range_pattern, time_str, re.IGNORECASE)
+        range_match = _TIME_RANGE_RE.match(time_str)
         
         if range_match:
             start_time = self._normalize_time_format(range_match.group(1))
@@ -684,87 +897,48 @@ class BuskerScraper:
         start_time = single_time
         
         # Calculate end time (add 2 hours as default duration)
-        try:
+        if _TIME_24H_RE.match(single_time):
             time_obj = datetime.strptime(single_time, '%H:%M')
             end_time_obj = time_obj + timedelta(hours=2)
             end_time = end_time_obj.strftime('%H:%M')
-        except ValueError:
+        else:
             end_time = single_time  # If parsing fails, use same time
             
         return start_time, end_time
     
     def _normalize_time_format(self, time_str: str) -> str:
         """Normalize time string to 24-hour HH:MM format."""
-        time_str = time_str.strip()
-        
-        # Handle formats like "7.30pm"
-        time_str = time_str.replace('.', ':')
-        
-        # Handle 12-hour format
-        if 'am' in time_str.lower() or 'pm' in time_str.lower():
-            try:
-                # Handle formats like "7:30pm" or "7:30 PM"
-                if ':' in time_str:
-                    time_obj = datetime.strptime(time_str.upper(), '%I:%M %p')
-                else:
-                    # Handle formats like "7pm" - add minutes
-                    time_str = re.sub(r'(\d+)([ap]m)', r'\1:00\2', time_str, flags=re.IGNORECASE)
-                    time_obj = datetime.strptime(time_str.upper(), '%I:%M %p')
-                
-                return time_obj.strftime('%H:%M')
-            except ValueError:
-                # If parsing fails, return original
-                self.logger.warning(f"Could not parse time: {time_str}")
-                return time_str
-        else:
-            # Handle 24-hour format
-            if ':' not in time_str:
-                # If no colon, assume it's like "1900" for 19:00
-                if len(time_str) == 4 and time_str.isdigit():
-                    time_str = time_str[:2] + ':' + time_str[2:]
-                elif len(time_str) == 3 and time_str.isdigit():
-                    time_str = time_str[0] + ':' + time_str[1:]
-            
-            # Validate 24-hour format
-            try:
-                time_obj = datetime.strptime(time_str, '%H:%M')
-                return time_str
-            except ValueError:
-                self.logger.warning(f"Could not parse time: {time_str}")
-                return time_str
+        normalized_time, parsed = _normalize_time(time_str.strip())
+        if not parsed:
+            # If parsing fails, return original
+            self.logger.warning(f"Could not parse time: {normalized_time}")
+        return normalized_time
     
     def _extract_busker_id(self, url: str) -> str:
         """Extract busker ID from URL."""
         # Extract the UUID from the URL
-        match = re.search(r'[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}', url, re.IGNORECASE)
+        match = _UUID_RE.search(url)
         return match.group(0) if match else "unknown"
     
-    def validate_scraped_data(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def validate_scraped_data(self, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Validate and clean scraped data."""
-        validated_events = []
+        return [event for event in events if self._is_valid_event(event)]
+    
+    def _is_valid_event(self, event: Dict[str, Any]) -> bool:
+        """Check that an event has all the required fields in the expected formats, logging why if not."""
+        # Validate required fields
+        if not all(key in event for key in ['date', 'start_time', 'location']):
+            self.logger.warning(f"Event missing required fields: {event}")
+            return False
         
-        for event in events:
-            # Validate required fields
-            if not all(key in event for key in ['date', 'start_time', 'location']):
-                self.logger.warning(f"Event missing required fields: {event}")
-                continue
-            
-            # Validate date format
-            try:
-                datetime.strptime(event['date'], '%Y-%m-%d')
-            except ValueError:
-                self.logger.warning(f"Invalid date format: {event['date']}")
-                continue
-            
-            # Validate time format
-            try:
-                datetime.strptime(event['start_time'], '%H:%M')
-                if 'end_time' in event:
-                    datetime.strptime(event['end_time'], '%H:%M')
-            except ValueError:
-                self.logger.warning(f"Invalid time format in event: {event}")
-                continue
-            
-            validated_events.append(event)
+        # Validate date format, only checking that the day exists once the whole string has the right shape
+        if not _ISO_DATE_RE.fullmatch(event['date']) or not _is_calendar_date(event['date']):
+            self.logger.warning(f"Invalid date format: {event['date']}")
+            return False
+        
+        # Validate time format, with fullmatch so a trailing newline is rejected as strptime did
+        if not _TIME_24H_RE.fullmatch(event['start_time']) or ('end_time' in event and not _TIME_24H_RE.fullmatch(event['end_time'])):
+            self.logger.warning(f"Invalid time format in event: {event}")
+            return False
         
-        return validated_events
\ No newline at end of file
+        return True
\ No newline at end of file
@@ -0,0 +1,21 @@
+from functools import lru_cache
+from redis_manager import RedisManager
+from calendar_manager import CalendarManager
+from scraper import BuskerScraper
+
+# Shared instances so the API and scheduler authenticate with Google and open Redis pools only once
+
+@lru_cache(maxsize=None)
+def get_redis_manager() -> RedisManager:
+    """Get the shared RedisManager instance."""
+    return RedisManager()
+
+@lru_cache(maxsize=None)
+def get_calendar_manager() -> CalendarManager:
+    """Get the shared CalendarManager instance."""
+    return CalendarManager(redis_manager=get_redis_manager())
+
+@lru_cache(maxsize=None)
+def get_scraper() -> BuskerScraper:
+    """Get the shared BuskerScraper instance."""
+    return BuskerScraper()
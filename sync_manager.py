@@ -1,24 +1,30 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import re
 from typing import Dict, Any, List
-from calendar_manager import CalendarManager
-from redis_manager import RedisManager
+from services import get_redis_manager, get_calendar_manager
 from config import Config
-from utils import get_logger, get_current_singapore_time
+from utils import get_logger, get_current_singapore_time, generate_event_hashes
 from datetime import datetime, timedelta
 
+# Summaries of the calendar events this app creates
+_BUSKER_SUMMARY_RE = re.compile(r'busker|performance', re.IGNORECASE)
+
 class SyncManager:
     """Manages synchronization and reconciliation between Redis cache and Google Calendar."""
     
-    def __init__(self):
+    def __init__(self, calendar_manager=None, redis_manager=None):
         self.logger = get_logger(__name__)
-        self.calendar_manager = CalendarManager()
-        self.redis_manager = RedisManager()
+        # Collaborators default to the process-wide shared instances
+        self.calendar_manager = calendar_manager or get_calendar_manager()
+        self.redis_manager = redis_manager or get_redis_manager()
     
     def reconcile_calendar_with_redis(self) -> Dict[str, Any]:
         """Reconcile Google Calendar with Redis cache to identify and fix discrepancies."""
         self.logger.info("Starting calendar reconciliation...")
         
+        now = get_current_singapore_time()
         result = {
-            "timestamp": get_current_singapore_time().isoformat(),
+            "timestamp": now.isoformat(),
             "synced_events": 0,
             "deleted_events": 0,
             "created_events": 0,
@@ -28,8 +34,8 @@ class SyncManager:
         
         try:
             # Get all events from Redis for the next 90 days
-            current_date = get_current_singapore_time().strftime("%Y-%m-%d")
-            end_date = (get_current_singapore_time() + timedelta(days=90)).strftime("%Y-%m-%d")
+            current_date = now.strftime("%Y-%m-%d")
+            end_date = (now + timedelta(days=90)).strftime("%Y-%m-%d")
             
             redis_events = self.redis_manager.get_events_by_date_range(current_date, end_date)
             self.logger.info(f"Found {len(redis_events)} events in Redis cache")
@@ -41,29 +47,25 @@ class SyncManager:
             calendar_events = self.calendar_manager.list_events(start_datetime, end_datetime)
             self.logger.info(f"Found {len(calendar_events)} events in Google Calendar")
             
-            # Create mappings for comparison
+            # Create mappings for comparison, keyed by (date, start time, location) tuples
             redis_event_map = {}
             for event in redis_events:
-                event_hash = f"{event['date']}_{event['start_time']}_{event['location']}"
-                redis_event_map[event_hash] = event
+                event_key = (event['date'], event['start_time'], event['location'])
+                redis_event_map[event_key] = event
             
             calendar_event_map = {}
             for event in calendar_events:
                 # Extract date and time from calendar event
                 start_time_str = event.get('start', {}).get('dateTime', '')
                 if start_time_str:
-                    # Parse date and time from ISO format
+                    # Google Calendar returns a fixed ISO format (YYYY-MM-DDTHH:MM:SS+HH:MM), so slice out the date and time
                     try:
-                        import re
-                        date_match = re.search(r'(\d{4}-\d{2}-\d{2})', start_time_str)
-                        time_match = re.search(r'T(\d{2}:\d{2})', start_time_str)
                         location = event.get('location', '')
                         
-                        if date_match and time_match:
-                            date_str = date_match.group(1)
-                            time_str = time_match.group(1)
-                            event_hash = f"{date_str}_{time_str}_{location}"
-                            calendar_event_map[event_hash] = {
+                        if len(start_time_str) >= 16 and start_time_str[10] == 'T':
+                            date_str = start_time_str[:10]
+                            time_str = start_time_str[11:16]
+                            calendar_event_map[(date_str, time_str, location)] = {
                                 'id': event['id'],
                                 'summary': event['summary'],
                                 'location': location,
@@ -73,67 +75,83 @@ class SyncManager:
                     except Exception as e:
                         self.logger.warning(f"Could not parse calendar event time: {event.get('summary', 'Unknown')}, error: {e}")
             
-            # Find events that exist in Redis but not in Calendar (need to be created)
-            redis_only = set(redis_event_map.keys()) - set(calendar_event_map.keys())
-            for event_hash in redis_only:
-                try:
-                    redis_event = redis_event_map[event_hash]
-                    event_id = self.calendar_manager.create_event(redis_event)
+            # Partition the events once: in both, only in Redis (need to be created) and only in Calendar
+            redis_keys = redis_event_map.keys()
+            calendar_keys = calendar_event_map.keys()
+            common_events = redis_keys & calendar_keys
+            redis_only = redis_keys - common_events
+            calendar_only = calendar_keys - common_events
+            
+            # Create the events that exist in Redis but not in Calendar
+            missing_events = [redis_event_map[event_key] for event_key in redis_only]
+            if missing_events:
+                # Create them with concurrent batch requests, then record the new IDs in one pipeline
+                missing_hashes = generate_event_hashes(missing_events)
+                created_ids = self.calendar_manager.create_events_batch(missing_events, missing_hashes)
+                
+                created_events = []
+                created_hashes = []
+                for event_hash, redis_event in zip(missing_hashes, missing_events):
+                    event_id = created_ids.get(event_hash)
                     if event_id:
-                        redis_event['calendar_event_id'] = event_id
-                        self.redis_manager.store_event(redis_event)
+                        created_events.append((redis_event, event_id))
+                        created_hashes.append(event_hash)
                         result["created_events"] += 1
                         self.logger.info(f"Created missing event in calendar: {redis_event['date']} {redis_event['start_time']} at {redis_event['location']}")
                     else:
                         result["errors"].append(f"Failed to create event: {redis_event}")
-                except Exception as e:
-                    result["errors"].append(f"Error creating event {redis_event_hash}: {e}")
-                    self.logger.error(f"Error creating event {event_hash}: {e}")
+                
+                self.redis_manager.update_events_bulk(created_events, created_hashes)
             
-            # Find events that exist in Calendar but not in Redis (might need deletion)
-            calendar_only = set(calendar_only) - set(redis_event_map.keys())
-            for event_hash in calendar_only:
+            # Check the events that exist in Calendar but not in Redis (might need deletion)
+            for event_key in calendar_only:
                 try:
-                    calendar_event = calendar_event_map[event_hash]
+                    calendar_event = calendar_event_map[event_key]
                     # Check if this is a busker event by looking at the summary
-                    if 'busker' in calendar_event['summary'].lower() or 'performance' in calendar_event['summary'].lower():
+                    if _BUSKER_SUMMARY_RE.search(calendar_event['summary']):
                         # This might be an old event that was not properly removed from calendar
                         # For safety, we won't delete automatically - just log for review
                         self.logger.info(f"Found calendar event not in Redis (might need manual review): {calendar_event['summary']} on {calendar_event['date']}")
                 except Exception as e:
-                    result["errors"].append(f"Error checking calendar-only event {event_hash}: {e}")
-            
-            # Find events that exist in both but may need updating
-            common_events = set(redis_event_map.keys()) & set(calendar_event_map.keys())
-            for event_hash in common_events:
-                try:
-                    redis_event = redis_event_map[event_hash]
-                    calendar_event = calendar_event_map[event_hash]
-                    
-                    # Compare key fields to see if update is needed
-                    calendar_summary = calendar_event['summary']
-                    expected_summary = f"{redis_event['busker_name']} - Busking Performance"
-                    
-                    # Check if details match
-                    needs_update = (
-                        expected_summary != calendar_summary or
-                        redis_event['location'] != calendar_event['location']
-                    )
-                    
-                    if needs_update:
-                        # Update the calendar event with Redis data
-                        success = self.calendar_manager.update_event(
-                            calendar_event['id'], 
-                            redis_event
-                        )
-                        if success:
-                            result["updated_events"] += 1
-                            self.logger.info(f"Updated event in calendar: {redis_event['date']} {redis_event['start_time']}")
-                        else:
-                            result["errors"].append(f"Failed to update event: {redis_event}")
-                except Exception as e:
-                    result["errors"].append(f"Error updating event {event_hash}: {e}")
-                    self.logger.error(f"Error updating event {event_hash}: {e}")
+                    result["errors"].append(f"Error checking calendar-only event {event_key}: {e}")
+            
+            # Check the events that exist in both, which may need updating
+            to_update = []
+            for event_key in common_events:
+                redis_event = redis_event_map[event_key]
+                calendar_event = calendar_event_map[event_key]
+                
+                # Compare key fields to see if update is needed
+                calendar_summary = calendar_event['summary']
+                expected_summary = f"{redis_event['busker_name']} - Busking Performance"
+                
+                # Check if details match
+                needs_update = (
+                    expected_summary != calendar_summary or
+                    redis_event['location'] != calendar_event['location']
+                )
+                
+                if needs_update:
+                    to_update.append((event_key, calendar_event['id'], redis_event))
+            
+            if to_update:
+                # Update the calendar events with Redis data concurrently, each worker using its own HTTP client
+                with ThreadPoolExecutor(max_workers=min(Config.CALENDAR_CONCURRENCY, len(to_update))) as executor:
+                    futures = {
+                        executor.submit(self.calendar_manager.update_event, calendar_event_id, redis_event): (event_key, redis_event)
+                        for event_key, calendar_event_id, redis_event in to_update
+                    }
+                    for future in as_completed(futures):
+                        event_key, redis_event = futures[future]
+                        try:
+                            if future.result():
+                                result["updated_events"] += 1
+                                self.logger.info(f"Updated event in calendar: {redis_event['date']} {redis_event['start_time']}")
+                            else:
+                                result["errors"].append(f"Failed to update event: {redis_event}")
+                        except Exception as e:
+                            result["errors"].append(f"Error updating event {event_key}: {e}")
+                            self.logger.error(f"Error updating event {event_key}: {e}")
             
             result["synced_events"] = len(common_events)
             self.logger.info(f"Reconciliation completed: {result}")
@@ -166,28 +184,33 @@ class SyncManager:
         
         try:
             # Get all events from Redis for the next 90 days
-            current_date = get_current_singapore_time().strftime("%Y-%m-%d")
-            end_date = (get_current_singapore_time() + timedelta(days=90)).strftime("%Y-%m-%d")
+            now = get_current_singapore_time()
+            current_date = now.strftime("%Y-%m-%d")
+            end_date = (now + timedelta(days=90)).strftime("%Y-%m-%d")
             
             redis_events = self.redis_manager.get_events_by_date_range(current_date, end_date)
             
             result["total_events"] = len(redis_events)
             
-            for event in redis_events:
-                if 'calendar_event_id' in event and event['calendar_event_id']:
-                    result["events_with_calendar_id"] += 1
+            missing_id_events = [event for event in redis_events if not event.get('calendar_event_id')]
+            result["events_with_calendar_id"] = len(redis_events) - len(missing_id_events)
+            result["events_without_calendar_id"] = len(missing_id_events)
+            
+            # List the calendar once for all affected dates instead of once per event
+            day_index = self.calendar_manager.prefetch_day_index({event['date'] for event in missing_id_events})
+            
+            found_events = []
+            for event in missing_id_events:
+                # Try to find the event in Google Calendar
+                existing_event_id = self.calendar_manager.event_exists(event, day_index)
+                if existing_event_id:
+                    found_events.append((event, existing_event_id))
+                    self.logger.info(f"Found and updated missing calendar ID for event: {event['date']} {event['start_time']}")
                 else:
-                    result["events_without_calendar_id"] += 1
-                    
-                    # Try to find the event in Google Calendar
-                    existing_event_id = self.calendar_manager.event_exists(event)
-                    if existing_event_id:
-                        # Update the Redis entry with the calendar event ID
-                        event['calendar_event_id'] = existing_event_id
-                        self.redis_manager.store_event(event)
-                        self.logger.info(f"Found and updated missing calendar ID for event: {event['date']} {event['start_time']}")
-                    else:
-                        result["validation_errors"].append(f"Event not found in calendar: {event}")
+                    result["validation_errors"].append(f"Event not found in calendar: {event}")
+            
+            # Update the Redis entries with the calendar event IDs in one pipeline
+            self.redis_manager.update_events_bulk(found_events)
         
         except Exception as e:
             result["validation_errors"].append(f"Error validating Redis integrity: {e}")
@@ -36,6 +36,7 @@ def main():
     
     print(f"🎯 Scraping URL: {Config.BUSKER_URL}")
     
+    scraper = None
     try:
         # Initialize scraper
         scraper = BuskerScraper()
@@ -72,6 +73,10 @@ def main():
         traceback.print_exc()
         print(f"❌ Scraping failed: {e}")
         return False
+    finally:
+        # Stop the browser and the Playwright driver the scraper keeps running
+        if scraper is not None:
+            scraper.close()
 
 if __name__ == "__main__":
     success = main()
@@ -1,8 +1,10 @@
 import hashlib
 import logging
+import time
 from datetime import datetime
-from typing import Dict, Any
-import pytz
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Optional
+from zoneinfo import ZoneInfo
 
 def setup_logging(level: str = 'INFO'):
     """Set up logging configuration."""
@@ -15,50 +17,87 @@ def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the specified name."""
     return logging.getLogger(name)
 
+@lru_cache(maxsize=8192)
+def _event_hash(date: str, start_time: str, location: str, busker_id: str) -> str:
+    """Hash the key properties that define an event's uniqueness, caching repeat events."""
+    return hashlib.sha256(f"{date}|{start_time}|{location}|{busker_id}".encode()).hexdigest()
+
 def generate_event_hash(event_data: Dict[str, Any]) -> str:
     """Generate a unique hash for an event based on its key properties."""
-    # Create a string from the key properties that define uniqueness
-    hash_string = f"{event_data['date']}|{event_data['start_time']}|{event_data['location']}|{event_data.get('busker_id', '')}"
-    return hashlib.sha256(hash_string.encode()).hexdigest()
+    return _event_hash(event_data['date'], event_data['start_time'], event_data['location'], event_data.get('busker_id', ''))
+
+def generate_event_hashes(events: List[Dict[str, Any]]) -> List[str]:
+    """Generate the hashes for a list of events, in order."""
+    return [
+        _event_hash(event['date'], event['start_time'], event['location'], event.get('busker_id', ''))
+        for event in events
+    ]
+
+@lru_cache(maxsize=None)
+def get_timezone(timezone_str: str):
+    """Get a cached timezone object for the given name."""
+    return ZoneInfo(timezone_str)
 
+def _parse_datetime(date_str: str, time_str: str) -> datetime:
+    """Parse YYYY-MM-DD and HH:MM strings into a naive datetime."""
+    try:
+        # The C ISO parser handles the usual zero-padded times much faster than strptime
+        return datetime.fromisoformat(f"{date_str}T{time_str}")
+    except ValueError:
+        # Times like "9:30" aren't ISO, but strptime accepts them
+        return datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+
+@lru_cache(maxsize=2048)
 def format_datetime_for_calendar(date_str: str, time_str: str, timezone_str: str = 'Asia/Singapore') -> str:
     """Format date and time strings into ISO 8601 format for Google Calendar."""
-    # Parse the date and time
-    dt_str = f"{date_str} {time_str}"
-    
     # Parse the datetime assuming it's in the specified timezone
-    tz = pytz.timezone(timezone_str)
-    dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
+    tz = get_timezone(timezone_str)
+    dt = _parse_datetime(date_str, time_str)
     
-    # Localize to the specified timezone
-    localized_dt = tz.localize(dt)
+    # Attach the specified timezone
+    localized_dt = dt.replace(tzinfo=tz)
     
     # Return in ISO 8601 format
     return localized_dt.isoformat()
 
 def parse_singapore_datetime(date_str: str, time_str: str) -> datetime:
     """Parse date and time strings in Singapore timezone."""
-    tz = pytz.timezone('Asia/Singapore')
-    dt_str = f"{date_str} {time_str}"
-    dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
-    return tz.localize(dt)
+    tz = get_timezone('Asia/Singapore')
+    return _parse_datetime(date_str, time_str).replace(tzinfo=tz)
 
 def get_current_singapore_time() -> datetime:
     """Get the current time in Singapore timezone."""
-    sg_tz = pytz.timezone('Asia/Singapore')
+    sg_tz = get_timezone('Asia/Singapore')
     return datetime.now(sg_tz)
 
-def retry_with_backoff(func, max_retries: int = 3, delay: int = 5):
-    """Execute a function with retry logic and exponential backoff."""
-    for attempt in range(max_retries):
+def profile_call(func, logger: logging.Logger, limit: int = 20):
+    """Call func under cProfile, log its top functions by cumulative time and return its result."""
+    import cProfile
+    import io
+    import pstats
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return func()
+    finally:
+        profiler.disable()
+        stats_output = io.StringIO()
+        pstats.Stats(profiler, stream=stats_output).sort_stats('cumulative').print_stats(limit)
+        logger.info(f"Profile of {getattr(func, '__name__', 'call')}:\n{stats_output.getvalue()}")
+
+def retry_with_backoff(func, max_retries: int = 3, delay: int = 5, min_wait: Optional[Callable[[Exception], float]] = None):
+    """Execute a function with retry logic and exponential backoff, waiting at least min_wait(error) between attempts."""
+    # Exponential backoff, worked out once up front
+    wait_times = [delay * (1 << attempt) for attempt in range(max_retries)]
+    for attempt, wait_time in enumerate(wait_times):
         try:
             return func()
         except Exception as e:
             if attempt == max_retries - 1:
                 raise e
-            wait_time = delay * (2 ** attempt)  # Exponential backoff
+            if min_wait:
+                wait_time = max(wait_time, min_wait(e))
             get_logger(__name__).warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {wait_time}s...")
-            import time
             time.sleep(wait_time)
     
     raise Exception(f"Function failed after {max_retries} attempts")
\ No newline at end of file